@@ -116,6 +116,11 @@ class StrategyConfig(BaseModel):
     bounce_density_erosion_exit_percent: float = Field(gt=0, le=100, description="Density erosion exit")
     bounce_density_stable_threshold_percent: float = Field(gt=0, le=100, description="Density stable threshold")
 
+    # Density analysis range of interest around mid price (None = whole book)
+    density_roi_percent: Optional[float] = Field(
+        default=None, gt=0, le=100, description="Density analysis range around mid price (%)"
+    )
+
     # Take-profit parameters
     tp_slowdown_multiplier: float = Field(gt=0, description="Take profit slowdown multiplier")
     tp_local_extrema_hours: int = Field(gt=0, description="Local extrema hours")
@@ -10,10 +10,13 @@ This module manages order book data, including:
 """
 
 import asyncio
-from collections import deque
-from datetime import datetime, timedelta
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional
+
+import numpy as np
 
 from src.storage.db_manager import DatabaseManager
 from src.storage.models import CoinParameters, Density, OrderBook, OrderSide, PriceLevel
@@ -21,6 +24,50 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_ZERO = Decimal(0)
+_HUNDRED = Decimal(100)
+
+
+class _HistoryBuffer:
+    """
+    Fixed-capacity ring buffer of float64 rows (timestamp first).
+
+    Every row is written twice, at ``head`` and ``head + capacity``, so the
+    buffered window is always one contiguous slice of the backing array.
+    """
+
+    __slots__ = ("_data", "_capacity", "_head", "_count")
+
+    def __init__(self, capacity: int, columns: int):
+        self._data = np.empty((columns, 2 * capacity), dtype=np.float64)
+        self._capacity = capacity
+        self._head = 0
+        self._count = 0
+
+    def append(self, *values: float) -> None:
+        """Append one row, overwriting the oldest when full."""
+        head = self._head
+        self._data[:, head] = values
+        self._data[:, head + self._capacity] = values
+        self._head = (head + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def window(self, since: float) -> np.ndarray:
+        """
+        Get the rows with timestamp >= since.
+
+        Args:
+            since: Oldest timestamp to include
+
+        Returns:
+            (columns, n) array, oldest first (a copy, safe to read while
+            the buffer keeps being appended to)
+        """
+        start = (self._head - self._count) % self._capacity
+        rows = self._data[:, start:start + self._count]
+        return rows[:, int(np.searchsorted(rows[0], since)):].copy()
+
 
 class OrderBookManager:
     """
@@ -52,10 +99,20 @@ class OrderBookManager:
         # In-memory storage
         self._current_orderbooks: dict[str, OrderBook] = {}
         self._tracked_densities: dict[str, list[Density]] = {}
+        self._densities_by_side: dict[str, dict[OrderSide, list[Density]]] = {}
+        self._densities_by_erosion: dict[str, dict[OrderSide, list[Density]]] = {}
+        self._density_index: dict[str, dict[tuple[OrderSide, Decimal], Density]] = {}
+
+        # Symbols whose densities changed since the last analysis pass
+        self._dirty_symbols: set[str] = set()
+
+        # Version per symbol, bumped on every orderbook and density change
+        self._sequences: dict[str, int] = {}
 
         # Price and volume history for take-profit analysis
-        self.price_history: dict[str, deque] = {}
-        self.volume_history: dict[str, deque] = {}
+        # (timestamps are time.monotonic() seconds)
+        self.price_history: dict[str, _HistoryBuffer] = {}
+        self.volume_history: dict[str, _HistoryBuffer] = {}
         self.history_max_points = 60  # ~30 seconds at 2 updates/sec
 
         # Background tasks
@@ -107,6 +164,7 @@ class OrderBookManager:
         """
         symbol = orderbook.symbol
         self._current_orderbooks[symbol] = orderbook
+        self._sequences[symbol] = self._sequences.get(symbol, 0) + 1
 
         # Get coin parameters for this symbol
         params = self.db_manager.coin_params_cache.get_sync(symbol)
@@ -121,6 +179,10 @@ class OrderBookManager:
         # Detect current densities and track lifecycle
         try:
             await self._process_densities(orderbook, params)
+            self._dirty_symbols.add(symbol)
+            # Densities changed after the await: bump again for readers
+            # that sampled the sequence mid-update
+            self._sequences[symbol] += 1
         except Exception as e:
             logger.error(
                 "density_detection_failed",
@@ -129,21 +191,23 @@ class OrderBookManager:
                 exc_info=True
             )
 
+        now = time.monotonic()
+
         # Track price history
-        mid_price = orderbook.get_mid_price()
+        mid_price = orderbook.get_mid_price_float()
         if mid_price:
             if symbol not in self.price_history:
-                self.price_history[symbol] = deque(maxlen=self.history_max_points)
+                self.price_history[symbol] = _HistoryBuffer(self.history_max_points, 2)
 
-            self.price_history[symbol].append((datetime.now(), mid_price))
+            self.price_history[symbol].append(now, mid_price)
 
         # Track volume history
         if symbol not in self.volume_history:
-            self.volume_history[symbol] = deque(maxlen=self.history_max_points)
+            self.volume_history[symbol] = _HistoryBuffer(self.history_max_points, 3)
 
-        bid_volume = orderbook.get_total_volume(OrderSide.BID)
-        ask_volume = orderbook.get_total_volume(OrderSide.ASK)
-        self.volume_history[symbol].append((datetime.now(), bid_volume, ask_volume))
+        bid_volume = orderbook.get_total_volume_float(OrderSide.BID)
+        ask_volume = orderbook.get_total_volume_float(OrderSide.ASK)
+        self.volume_history[symbol].append(now, bid_volume, ask_volume)
 
     async def _process_densities(
         self, orderbook: OrderBook, params: CoinParameters
@@ -210,8 +274,8 @@ class OrderBookManager:
             "densities_detected",
             symbol=orderbook.symbol,
             total_count=len(densities),
-            bid_count=len([d for d in densities if d.side == OrderSide.BID]),
-            ask_count=len([d for d in densities if d.side == OrderSide.ASK]),
+            bid_count=len(bid_densities) if orderbook.bids else 0,
+            ask_count=len(ask_densities) if orderbook.asks else 0,
         )
 
         return densities
@@ -259,16 +323,17 @@ class OrderBookManager:
 
             # Criterion 3: Percentage threshold (of total side volume)
             meets_percentage = volume >= (
-                total_volume * params.density_threshold_percent / Decimal("100")
+                total_volume * params.density_threshold_percent / _HUNDRED
             )
 
             # All 3 criteria must pass
             if meets_absolute and meets_relative and meets_percentage:
                 # Calculate metrics
-                volume_percent = (volume / total_volume * Decimal("100")) if total_volume > 0 else Decimal("0")
-                relative_strength = (volume / avg_volume) if avg_volume > 0 else Decimal("0")
+                volume_percent = (volume / total_volume * _HUNDRED) if total_volume > 0 else _ZERO
+                relative_strength = (volume / avg_volume) if avg_volume > 0 else _ZERO
 
-                density = Density(
+                # Inputs come from validated PriceLevels; skip re-validation
+                density = Density.model_construct(
                     symbol=symbol,
                     price_level=price,
                     volume=volume,
@@ -303,8 +368,7 @@ class OrderBookManager:
             return densities
 
         # Group by side
-        bid_densities = [d for d in densities if d.side == OrderSide.BID]
-        ask_densities = [d for d in densities if d.side == OrderSide.ASK]
+        bid_densities, ask_densities = self._split_by_side(densities)
 
         # Process each side separately
         self._mark_clusters_for_side(bid_densities, cluster_range_percent)
@@ -336,7 +400,7 @@ class OrderBookManager:
             for j in range(i + 1, len(sorted_densities)):
                 price_diff_percent = abs(
                     (sorted_densities[j].price_level - sorted_densities[i].price_level)
-                    / sorted_densities[i].price_level * Decimal("100")
+                    / sorted_densities[i].price_level * _HUNDRED
                 )
 
                 if price_diff_percent <= cluster_range_percent:
@@ -394,14 +458,14 @@ class OrderBookManager:
                 logger.info(
                     "density_disappeared",
                     symbol=symbol,
-                    price_level=float(disappeared_density.price_level),
-                    side=disappeared_density.side.value,
+                    price_level=disappeared_density.price_level,
+                    side=disappeared_density.side,
                 )
             except Exception as e:
                 logger.error(
                     "failed_to_mark_density_disappeared",
                     symbol=symbol,
-                    price_level=float(disappeared_density.price_level),
+                    price_level=disappeared_density.price_level,
                     error=str(e),
                 )
 
@@ -416,18 +480,18 @@ class OrderBookManager:
                 logger.info(
                     "new_density_detected",
                     symbol=symbol,
-                    price_level=float(new_density.price_level),
-                    side=new_density.side.value,
-                    volume=float(new_density.volume),
-                    volume_percent=float(new_density.volume_percent) if new_density.volume_percent else None,
-                    relative_strength=float(new_density.relative_strength) if new_density.relative_strength else None,
+                    price_level=new_density.price_level,
+                    side=new_density.side,
+                    volume=new_density.volume,
+                    volume_percent=new_density.volume_percent,
+                    relative_strength=new_density.relative_strength,
                     is_cluster=new_density.is_cluster,
                 )
             except Exception as e:
                 logger.error(
                     "failed_to_save_density",
                     symbol=symbol,
-                    price_level=float(new_density.price_level),
+                    price_level=new_density.price_level,
                     error=str(e),
                 )
 
@@ -441,8 +505,70 @@ class OrderBookManager:
             current.initial_volume = previous.initial_volume
             current.appeared_at = previous.appeared_at
 
-        # Update tracked densities
+        # Compute erosion for all densities in one vectorized pass
+        self._cache_erosions(current_densities)
+
+        # Update tracked densities (kept sorted by price for range queries)
+        current_densities.sort(key=lambda d: d.price_level)
         self._tracked_densities[symbol] = current_densities
+        bid_densities, ask_densities = self._split_by_side(current_densities)
+        by_side = {OrderSide.BID: bid_densities, OrderSide.ASK: ask_densities}
+        self._densities_by_side[symbol] = by_side
+        self._density_index[symbol] = {
+            (d.side, d.price_level): d for d in current_densities
+        }
+
+        # Same per-side densities, least eroded first
+        def erosion(d: Density) -> float:
+            return d.erosion_cached
+
+        self._densities_by_erosion[symbol] = {
+            side: sorted(densities, key=erosion) for side, densities in by_side.items()
+        }
+
+    @staticmethod
+    def _split_by_side(densities: list[Density]) -> tuple[list[Density], list[Density]]:
+        """
+        Split densities into bid and ask lists in one pass, preserving order.
+
+        Args:
+            densities: Densities to split
+
+        Returns:
+            Tuple of (bid densities, ask densities)
+        """
+        bids: list[Density] = []
+        asks: list[Density] = []
+        bid_side = OrderSide.BID
+        for density in densities:
+            (bids if density.side is bid_side else asks).append(density)
+        return bids, asks
+
+    @staticmethod
+    def _cache_erosions(densities: list[Density]) -> None:
+        """
+        Compute erosion percentages for densities and cache them on each one.
+
+        Args:
+            densities: Densities whose initial_volume is final for this update
+        """
+        if not densities:
+            return
+
+        count = len(densities)
+        initial = np.fromiter(
+            (float(d.initial_volume) for d in densities), dtype=np.float64, count=count
+        )
+        current = np.fromiter(
+            (float(d.volume) for d in densities), dtype=np.float64, count=count
+        )
+        valid = initial > 0.0
+        erosions = np.where(
+            valid, (1.0 - current / np.where(valid, initial, 1.0)) * 100.0, 0.0
+        )
+
+        for density, erosion in zip(densities, erosions.tolist()):
+            density.cache_erosion(erosion)
 
     async def _snapshot_loop(self) -> None:
         """
@@ -500,66 +626,187 @@ class OrderBookManager:
         """
         return self._current_orderbooks.get(symbol)
 
-    def get_current_densities(self, symbol: str) -> list[Density]:
+    def get_orderbooks_bulk(self, symbols: Iterable[str]) -> dict[str, OrderBook]:
+        """
+        Get the current in-memory orderbooks for several symbols.
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Dict of symbol -> orderbook (symbols without one are omitted)
+        """
+        orderbooks = self._current_orderbooks
+        return {
+            symbol: orderbooks[symbol] for symbol in symbols if symbol in orderbooks
+        }
+
+    def get_sequence(self, symbol: str) -> int:
+        """
+        Get the orderbook update sequence number for a symbol.
+
+        The number increases with every orderbook update and again once its
+        densities are refreshed, so callers can cache values derived from
+        market data until it changes.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Monotonic version for the symbol (0 if never updated)
+        """
+        return self._sequences.get(symbol, 0)
+
+    def get_current_densities(
+        self, symbol: str, roi_percent: Optional[Decimal] = None
+    ) -> list[Density]:
         """
         Get currently tracked densities for a symbol.
 
+        When roi_percent is given, only densities within the range of interest
+        mid_price * (1 +/- roi_percent / 100) are returned. Densities are kept
+        sorted by price, so the range is located by binary search.
+
         Args:
             symbol: Trading symbol
+            roi_percent: Optional range of interest around mid price (%)
 
         Returns:
             List of current densities (empty list if none)
         """
-        return self._tracked_densities.get(symbol, [])
+        densities = self._tracked_densities.get(symbol, [])
+        if roi_percent is None or not densities:
+            return densities
 
-    def get_price_history(
-        self, symbol: str, seconds: int
-    ) -> list[tuple[datetime, Decimal]]:
+        orderbook = self._current_orderbooks.get(symbol)
+        mid_price = orderbook.get_mid_price() if orderbook else None
+        if not mid_price:
+            return densities
+
+        delta = mid_price * roi_percent / _HUNDRED
+        low = bisect_left(densities, mid_price - delta, key=lambda d: d.price_level)
+        high = bisect_right(densities, mid_price + delta, key=lambda d: d.price_level)
+        return densities[low:high]
+
+    def get_density(
+        self, symbol: str, side: OrderSide, price_level: Decimal
+    ) -> Optional[Density]:
         """
-        Get price history for a symbol.
+        Get the tracked density at an exact price level on one side.
 
         Args:
             symbol: Trading symbol
-            seconds: Number of seconds of history to return
+            side: Order book side (BID or ASK)
+            price_level: Density price level
+
+        Returns:
+            Density if currently tracked, None otherwise
+        """
+        index = self._density_index.get(symbol)
+        if not index:
+            return None
+        return index.get((side, price_level))
+
+    def get_current_densities_by_side(
+        self, symbol: str, side: OrderSide
+    ) -> list[Density]:
+        """
+        Get currently tracked densities for one side of the book.
+
+        Lists are split by side when densities are tracked, so callers
+        interested in a single side skip the other side entirely.
+
+        Args:
+            symbol: Trading symbol
+            side: Order book side (BID or ASK)
 
         Returns:
-            List of (timestamp, price) tuples
+            List of current densities on that side, sorted by price
         """
-        if symbol not in self.price_history:
+        by_side = self._densities_by_side.get(symbol)
+        if not by_side:
             return []
+        return by_side[side]
+
+    def get_current_densities_by_erosion(
+        self, symbol: str, side: OrderSide
+    ) -> list[Density]:
+        """
+        Get currently tracked densities for one side, least eroded first.
 
-        cutoff_time = datetime.now() - timedelta(seconds=seconds)
+        Lets callers looking for stable densities stop at the first one
+        above their erosion limit.
 
-        history = [
-            (ts, price)
-            for ts, price in self.price_history[symbol]
-            if ts >= cutoff_time
-        ]
+        Args:
+            symbol: Trading symbol
+            side: Order book side (BID or ASK)
 
-        return history
+        Returns:
+            List of current densities on that side, sorted by erosion ascending
+        """
+        by_erosion = self._densities_by_erosion.get(symbol)
+        if not by_erosion:
+            return []
+        return by_erosion[side]
 
-    def get_volume_history(
+    def is_dirty(self, symbol: str) -> bool:
+        """
+        Check whether densities changed since the last clear_dirty() call.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            True if densities were updated since last cleared
+        """
+        return symbol in self._dirty_symbols
+
+    def clear_dirty(self, symbol: str) -> None:
+        """
+        Mark densities for a symbol as analyzed.
+
+        Args:
+            symbol: Trading symbol
+        """
+        self._dirty_symbols.discard(symbol)
+
+    def get_price_history(
         self, symbol: str, seconds: int
-    ) -> list[tuple[datetime, Decimal, Decimal]]:
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Get volume history for a symbol.
+        Get price history for a symbol.
 
         Args:
             symbol: Trading symbol
             seconds: Number of seconds of history to return
 
         Returns:
-            List of (timestamp, bid_volume, ask_volume) tuples
+            (timestamps, prices) float64 arrays; timestamps are monotonic
+            seconds, ascending
         """
-        if symbol not in self.volume_history:
-            return []
+        history = self.price_history.get(symbol)
+        if history is None:
+            return np.empty(0), np.empty(0)
+
+        timestamps, prices = history.window(time.monotonic() - seconds)
+        return timestamps, prices
+
+    def get_volume_history(
+        self, symbol: str, seconds: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get bid/ask volume history for a symbol.
 
-        cutoff_time = datetime.now() - timedelta(seconds=seconds)
+        Args:
+            symbol: Trading symbol
+            seconds: Number of seconds of history to return
 
-        history = [
-            (ts, bid_vol, ask_vol)
-            for ts, bid_vol, ask_vol in self.volume_history[symbol]
-            if ts >= cutoff_time
-        ]
+        Returns:
+            (bid_volumes, ask_volumes) float64 arrays, oldest first
+        """
+        history = self.volume_history.get(symbol)
+        if history is None:
+            return np.empty(0), np.empty(0)
 
-        return history
+        _, bid_volumes, ask_volumes = history.window(time.monotonic() - seconds)
+        return bid_volumes, ask_volumes
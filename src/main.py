@@ -46,6 +46,7 @@ class TradingBot:
         self.logger = get_logger(__name__)
         self._running = False
         self._tasks = []
+        self._stopped = asyncio.Event()
 
         # Components (initialized in start())
         self.db_manager: Optional[DatabaseManager] = None
@@ -102,7 +103,11 @@ class TradingBot:
             # 3. Initialize analysis
             self.logger.info("initializing_analysis_components")
             self.trend_analyzer = TrendAnalyzer(db_manager=self.db_manager)
-            self.density_analyzer = DensityAnalyzer(orderbook_manager=self.orderbook_manager)
+            density_roi_percent = self.config.strategy.density_roi_percent
+            self.density_analyzer = DensityAnalyzer(
+                orderbook_manager=self.orderbook_manager,
+                roi_percent=Decimal(str(density_roi_percent)) if density_roi_percent else None,
+            )
             self.signal_generator = SignalGenerator(
                 db_manager=self.db_manager,
                 orderbook_manager=self.orderbook_manager,
@@ -112,13 +117,14 @@ class TradingBot:
 
             # 4. Initialize execution
             self.logger.info("initializing_execution_components")
+            position_size_usdt = Decimal(str(self.config.trading.position_size_usd))
             self.signal_validator = SignalValidator(
                 db_manager=self.db_manager,
                 orderbook_manager=self.orderbook_manager,
                 max_concurrent_positions=self.config.trading.max_concurrent_positions,
                 max_exposure_percent=Decimal(str(self.config.trading.max_exposure_percent)),
                 max_volume_impact_percent=Decimal(str(getattr(self.config.trading, 'max_volume_impact_percent', 1))),
-                position_size_usdt=Decimal(str(self.config.trading.position_size_usd)),
+                position_size_usdt=position_size_usdt,
                 leverage=self.config.trading.leverage,
             )
 
@@ -127,7 +133,7 @@ class TradingBot:
                 api_key=self.config.exchange.api_key,
                 api_secret=self.config.exchange.api_secret,
                 testnet=False,  # Using mainnet by default
-                position_size_usdt=Decimal(str(self.config.trading.position_size_usd)),
+                position_size_usdt=position_size_usdt,
                 leverage=self.config.trading.leverage,
             )
 
@@ -136,8 +142,10 @@ class TradingBot:
             self.position_monitor = PositionMonitor(
                 db_manager=self.db_manager,
                 orderbook_manager=self.orderbook_manager,
+                order_executor=self.order_executor,
                 check_interval_seconds=5,
             )
+            await self.position_monitor.start()
 
             self.safety_monitor = SafetyMonitor(
                 db_manager=self.db_manager,
@@ -145,6 +153,7 @@ class TradingBot:
                 initial_balance=Decimal("0"),  # Will be set on first check
                 max_loss_percent=Decimal("10"),  # Emergency shutdown at 10% loss
             )
+            await self.safety_monitor.start()
 
             # 6. Subscribe to active symbols
             self.logger.info("subscribing_to_active_symbols")
@@ -180,8 +189,11 @@ class TradingBot:
         self.logger.info("trading_bot_stopping")
         self._running = False
 
-        # Cancel tasks
+        # Cancel tasks (stop() may be called from one of them, e.g. the safety loop)
+        current_task = asyncio.current_task()
         for task in self._tasks:
+            if task is current_task:
+                continue
             task.cancel()
             try:
                 await task
@@ -189,6 +201,18 @@ class TradingBot:
                 pass
 
         # Stop components
+        if self.position_monitor:
+            try:
+                await self.position_monitor.stop()
+            except Exception as e:
+                self.logger.error("position_monitor_stop_error", error=str(e))
+
+        if self.safety_monitor:
+            try:
+                await self.safety_monitor.stop()
+            except Exception as e:
+                self.logger.error("safety_monitor_stop_error", error=str(e))
+
         if self.websocket_manager:
             try:
                 await self.websocket_manager.stop()
@@ -213,8 +237,13 @@ class TradingBot:
             except Exception as e:
                 self.logger.error("database_disconnect_error", error=str(e))
 
+        self._stopped.set()
         self.logger.info("trading_bot_stopped")
 
+    async def wait_until_stopped(self) -> None:
+        """Block until stop() has completed."""
+        await self._stopped.wait()
+
     async def _subscribe_to_symbols(self):
         """Subscribe to active symbols from market stats."""
         try:
@@ -293,8 +322,8 @@ class TradingBot:
                 self.logger.info(
                     "position_restored",
                     symbol=symbol,
-                    position_id=str(position.id),
-                    entry_price=float(position.entry_price),
+                    position_id=position.id,
+                    entry_price=position.entry_price,
                 )
 
             self.logger.info(
@@ -315,6 +344,15 @@ class TradingBot:
         """Generate and process trading signals."""
         self.logger.info("signal_generation_loop_started")
 
+        # Bind hot-path methods once; components don't change after start()
+        generate_signals_batch = self.signal_generator.generate_signals_batch
+        get_balance = self.order_executor.get_account_balance
+        validate_signal = self.signal_validator.validate_signal
+        execute_signal = self.order_executor.execute_signal
+        start_monitoring = self.position_monitor.start_monitoring
+        log_info = self.logger.info
+        log_error = self.logger.error
+
         while self._running:
             try:
                 await asyncio.sleep(10)  # Check every 10 seconds
@@ -326,35 +364,41 @@ class TradingBot:
 
                 symbols = await self.db_manager.get_active_symbols()
 
-                for symbol in symbols[:10]:  # Limit to 10
+                # Generate signals for all symbols at once (one market stats query)
+                signals_by_symbol = await generate_signals_batch(symbols[:10])  # Limit to 10
+
+                for symbol, signals in signals_by_symbol.items():
                     try:
-                        # Generate signals
-                        signals = await self.signal_generator.generate_signals(symbol)
+                        if not signals:
+                            continue
+
+                        # Real balance from exchange; re-fetched after each opened
+                        # position so later signals are validated against it
+                        balance = await get_balance()
 
                         for signal in signals:
-                            # CHANGED: Get real balance from exchange
-                            balance = await self.order_executor.get_account_balance()
-                            is_valid, reason = await self.signal_validator.validate_signal(signal, balance)
+                            is_valid, reason = await validate_signal(signal, balance)
 
                             if not is_valid:
-                                self.logger.info("signal_rejected", symbol=symbol, reason=reason)
+                                log_info("signal_rejected", symbol=symbol, reason=reason)
                                 continue
 
                             # Execute signal
-                            position = await self.order_executor.execute_signal(signal)
+                            position = await execute_signal(signal)
 
                             if position:
-                                await self.position_monitor.start_monitoring(position)
-                                self.logger.info(
+                                await start_monitoring(position)
+                                log_info(
                                     "position_opened_from_signal",
                                     symbol=symbol,
-                                    position_id=str(position.id),
-                                    direction=position.direction.value,
-                                    entry_price=float(position.entry_price),
+                                    position_id=position.id,
+                                    direction=position.direction,
+                                    entry_price=position.entry_price,
                                 )
+                                balance = await get_balance()
 
                     except Exception as e:
-                        self.logger.error(
+                        log_error(
                             "signal_processing_error",
                             symbol=symbol,
                             error=str(e),
@@ -377,70 +421,8 @@ class TradingBot:
             try:
                 await asyncio.sleep(1)  # CHANGED: Check every 1 second for real-time TP
 
-                # Get all monitored positions
-                monitored_positions = self.position_monitor.get_monitored_positions()
-
-                for position in monitored_positions:
-                    try:
-                        # Check if breakeven move is needed
-                        if not position.breakeven_moved:
-                            orderbook = self.orderbook_manager.get_current_orderbook(position.symbol)
-                            if orderbook:
-                                current_price = orderbook.get_mid_price()
-                                if current_price:
-                                    profit_percent = position.calculate_profit_percent(current_price)
-                                    params = self.db_manager.coin_params_cache.get_sync(position.symbol)
-
-                                    if params:
-                                        # Check breakeven condition based on strategy
-                                        should_move = False
-                                        if position.signal_type == SignalType.BREAKOUT:
-                                            if profit_percent >= params.breakout_breakeven_profit_percent:
-                                                should_move = True
-                                        elif position.signal_type == SignalType.BOUNCE:
-                                            # For bounce, check density erosion
-                                            densities = self.orderbook_manager.get_current_densities(position.symbol)
-                                            for d in densities:
-                                                if d.price_level == position.density_price:
-                                                    if d.erosion_percent() >= params.bounce_density_erosion_exit_percent:
-                                                        should_move = True
-                                                    break
-
-                                        if should_move:
-                                            # Move SL to breakeven on exchange
-                                            success = await self.order_executor.modify_stop_loss(
-                                                position.symbol,
-                                                position.entry_price
-                                            )
-
-                                            if success:
-                                                # Update in memory
-                                                position.stop_loss = position.entry_price
-                                                position.breakeven_moved = True
-
-                                                # Update in database
-                                                await self.db_manager.update_trade_stop_loss(
-                                                    position.id,
-                                                    position.entry_price,
-                                                    breakeven=True
-                                                )
-
-                                                self.logger.info(
-                                                    "stop_loss_moved_to_breakeven",
-                                                    symbol=position.symbol,
-                                                    position_id=str(position.id),
-                                                    entry_price=float(position.entry_price),
-                                                )
-
-                    except Exception as e:
-                        self.logger.error(
-                            "breakeven_check_error",
-                            symbol=position.symbol,
-                            error=str(e),
-                            exc_info=True,
-                        )
-
-                # Now check for positions to close
+                # Breakeven moves and exit checks; stop-loss updates are
+                # submitted to the exchange by the monitor's background worker
                 positions_to_close = await self.position_monitor.check_positions()
 
                 for position in positions_to_close:
@@ -476,16 +458,16 @@ class TradingBot:
                             self.logger.info(
                                 "position_closed",
                                 symbol=position.symbol,
-                                position_id=str(position.id),
+                                position_id=position.id,
                                 reason=position.exit_reason.value if position.exit_reason else "unknown",
-                                pnl=float(pnl),
-                                exit_price=float(current_price),
+                                pnl=pnl,
+                                exit_price=current_price,
                             )
                         else:
                             self.logger.error(
                                 "position_close_failed",
                                 symbol=position.symbol,
-                                position_id=str(position.id),
+                                position_id=position.id,
                                 message="Will retry on next check",
                             )
 
@@ -493,7 +475,7 @@ class TradingBot:
                         self.logger.error(
                             "position_close_error",
                             symbol=position.symbol,
-                            position_id=str(position.id) if hasattr(position, 'id') else 'unknown',
+                            position_id=position.id if hasattr(position, 'id') else 'unknown',
                             error=str(e),
                             exc_info=True,
                         )
@@ -512,13 +494,10 @@ class TradingBot:
 
         while self._running:
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-
-                # CHANGED: Get real balance
-                balance = await self.order_executor.get_account_balance()
+                # Fixed cadence (30 seconds); only the DB probe backs off on failures
+                await asyncio.sleep(self.safety_monitor.check_interval_seconds)
 
-                # Pass balance to safety monitor
-                # Note: safety_monitor.check_safety_conditions needs update to accept balance
+                # Safety monitor fetches (and caches) the balance itself
                 safety_ok = await self.safety_monitor.check_safety_conditions()
 
                 if not safety_ok:
@@ -572,8 +551,7 @@ async def main():
 
         # Keep running until stopped
         logger.info("bot_running_press_ctrl_c_to_stop")
-        while bot._running:
-            await asyncio.sleep(1)
+        await bot.wait_until_stopped()
 
     except Exception as e:
         logger.critical("bot_startup_failed", error=str(e), exc_info=True)
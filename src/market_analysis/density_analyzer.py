@@ -7,12 +7,25 @@ are being eroded (broken through) by market pressure.
 """
 
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.storage.models import Density, OrderSide, TrendDirection
 from src.data_collection.orderbook_manager import OrderBookManager
 from src.utils.logger import get_logger
 
+_ZERO = Decimal(0)
+_TWO = Decimal(2)
+
+# Breakout strength scoring (points out of 100)
+_EROSION_POINTS_MAX = Decimal(50)
+_CLUSTER_POINTS = Decimal(20)
+_STRENGTH_TIERS = (
+    (Decimal(5), Decimal(30)),
+    (Decimal(3), Decimal(20)),
+    (Decimal(2), Decimal(10)),
+)
+_SCORE_MAX = Decimal(100)
+
 
 class DensityAnalyzer:
     """
@@ -21,11 +34,21 @@ class DensityAnalyzer:
     Tracks volume changes in density levels and identifies when densities
     are being eroded (broken through) by market pressure.
     """
+
+    __slots__ = (
+        "orderbook_manager",
+        "erosion_threshold_percent",
+        "roi_percent",
+        "logger",
+        "_last_broken",
+        "_strongest_broken",
+    )
     
     def __init__(
         self,
         orderbook_manager: OrderBookManager,
         erosion_threshold_percent: Decimal = Decimal("30.0"),
+        roi_percent: Optional[Decimal] = None,
     ):
         """
         Initialize density analyzer.
@@ -33,19 +56,32 @@ class DensityAnalyzer:
         Args:
             orderbook_manager: OrderBook manager instance
             erosion_threshold_percent: Erosion % to consider density broken (default: 30%)
+            roi_percent: Only analyze densities within this % of mid price
+                (default: None = whole book)
         """
         self.orderbook_manager = orderbook_manager
         self.erosion_threshold_percent = erosion_threshold_percent
+        self.roi_percent = roi_percent
         self.logger = get_logger(__name__)
+
+        # Last broken-density result per symbol, reused until densities change
+        self._last_broken: Dict[str, List[Density]] = {}
+
+        # Most eroded broken density per (symbol, side), rebuilt with _last_broken
+        self._strongest_broken: Dict[Tuple[str, OrderSide], Density] = {}
         
         self.logger.info(
             "density_analyzer_initialized",
             erosion_threshold_percent=float(erosion_threshold_percent),
+            roi_percent=float(roi_percent) if roi_percent else None,
         )
         
     def get_broken_densities(self, symbol: str) -> List[Density]:
         """
         Get list of densities that have been broken (eroded).
+
+        The result is cached per symbol and reused until the orderbook
+        manager reports new densities for the symbol.
         
         Args:
             symbol: Trading symbol to analyze
@@ -53,35 +89,53 @@ class DensityAnalyzer:
         Returns:
             List of densities with erosion >= threshold
         """
+        if not self.orderbook_manager.is_dirty(symbol) and symbol in self._last_broken:
+            return self._last_broken[symbol]
+
+        # Clear before reading so updates arriving mid-scan are not lost
+        self.orderbook_manager.clear_dirty(symbol)
+        self._strongest_broken.pop((symbol, OrderSide.BID), None)
+        self._strongest_broken.pop((symbol, OrderSide.ASK), None)
+
         # Get current densities from orderbook manager
-        current_densities = self.orderbook_manager.get_current_densities(symbol)
+        current_densities = self.orderbook_manager.get_current_densities(
+            symbol, self.roi_percent
+        )
         
         if not current_densities:
             self.logger.debug(
                 "no_current_densities",
                 symbol=symbol,
             )
+            self._last_broken[symbol] = []
             return []
         
         broken_densities = []
+        threshold = float(self.erosion_threshold_percent)
         
         for density in current_densities:
-            erosion_percent = density.erosion_percent()
+            erosion_percent = density.erosion_cached
             
             # Check if erosion exceeds threshold
-            if erosion_percent >= self.erosion_threshold_percent:
+            if erosion_percent >= threshold:
                 self.logger.info(
                     "density_broken",
                     symbol=symbol,
-                    price_level=float(density.price_level),
-                    side=density.side.value,
-                    initial_volume=float(density.initial_volume),
-                    current_volume=float(density.volume),
-                    erosion_percent=float(erosion_percent),
+                    price_level=density.price_level,
+                    side=density.side,
+                    initial_volume=density.initial_volume,
+                    current_volume=density.volume,
+                    erosion_percent=erosion_percent,
                     is_cluster=density.is_cluster,
-                    relative_strength=float(density.relative_strength) if density.relative_strength else None,
+                    relative_strength=density.relative_strength,
                 )
                 broken_densities.append(density)
+
+                # Track the most eroded density per side (first wins on ties)
+                key = (symbol, density.side)
+                strongest = self._strongest_broken.get(key)
+                if strongest is None or erosion_percent > strongest.erosion_cached:
+                    self._strongest_broken[key] = density
         
         if broken_densities:
             self.logger.info(
@@ -90,6 +144,7 @@ class DensityAnalyzer:
                 count=len(broken_densities),
             )
         
+        self._last_broken[symbol] = broken_densities
         return broken_densities
         
     def get_strongest_broken_density(
@@ -105,32 +160,26 @@ class DensityAnalyzer:
         Returns:
             Density with highest erosion, or None if no broken densities
         """
-        broken = self.get_broken_densities(symbol)
-        
-        # Filter by side
-        side_broken = [d for d in broken if d.side == side]
-        
-        if not side_broken:
+        # Refreshes the per-side index if densities changed
+        self.get_broken_densities(symbol)
+
+        strongest = self._strongest_broken.get((symbol, side))
+        if strongest is None:
             self.logger.debug(
                 "no_broken_densities_on_side",
                 symbol=symbol,
-                side=side.value,
+                side=side,
             )
             return None
         
-        # Sort by erosion percent (highest first)
-        side_broken.sort(key=lambda d: d.erosion_percent(), reverse=True)
-        
-        strongest = side_broken[0]
-        
         self.logger.info(
             "strongest_broken_density",
             symbol=symbol,
-            side=side.value,
-            price_level=float(strongest.price_level),
-            erosion_percent=float(strongest.erosion_percent()),
+            side=side,
+            price_level=strongest.price_level,
+            erosion_percent=strongest.erosion_cached,
             is_cluster=strongest.is_cluster,
-            relative_strength=float(strongest.relative_strength) if strongest.relative_strength else None,
+            relative_strength=strongest.relative_strength,
         )
         
         return strongest
@@ -151,8 +200,8 @@ class DensityAnalyzer:
         
         self.logger.debug(
             "cluster_breakout_check",
-            price_level=float(density.price_level),
-            side=density.side.value,
+            price_level=density.price_level,
+            side=density.side,
             is_cluster=is_cluster,
         )
         
@@ -175,37 +224,35 @@ class DensityAnalyzer:
         Returns:
             Breakout strength score (0-100)
         """
-        score = Decimal("0")
-        
         # Base score from erosion (0-50 points)
         erosion = density.erosion_percent()
-        score += min(erosion / Decimal("2"), Decimal("50"))
+        score = min(erosion / _TWO, _EROSION_POINTS_MAX)
         
         # Cluster bonus (20 points)
         if density.is_cluster:
-            score += Decimal("20")
+            score += _CLUSTER_POINTS
         
         # Relative strength bonus (0-30 points)
         # Higher initial density relative to average = stronger
-        if density.relative_strength:
-            if density.relative_strength > Decimal("5"):
-                score += Decimal("30")
-            elif density.relative_strength > Decimal("3"):
-                score += Decimal("20")
-            elif density.relative_strength > Decimal("2"):
-                score += Decimal("10")
+        relative_strength = density.relative_strength
+        if relative_strength:
+            score += next(
+                (points for min_strength, points in _STRENGTH_TIERS
+                 if relative_strength > min_strength),
+                _ZERO,
+            )
         
         # Cap at 100
-        final_score = min(score, Decimal("100"))
+        final_score = min(score, _SCORE_MAX)
         
         self.logger.debug(
             "breakout_strength_calculated",
-            price_level=float(density.price_level),
-            side=density.side.value,
-            erosion=float(erosion),
+            price_level=density.price_level,
+            side=density.side,
+            erosion=erosion,
             is_cluster=density.is_cluster,
-            relative_strength=float(density.relative_strength) if density.relative_strength else None,
-            score=float(final_score),
+            relative_strength=density.relative_strength,
+            score=final_score,
         )
         
         return final_score
@@ -230,8 +277,8 @@ class DensityAnalyzer:
         
         self.logger.debug(
             "breakout_direction_determined",
-            price_level=float(density.price_level),
-            side=density.side.value,
+            price_level=density.price_level,
+            side=density.side,
             direction=direction,
         )
         
@@ -266,31 +313,45 @@ class DensityAnalyzer:
                 "strongest_bid": None,
                 "strongest_ask": None,
                 "recommended_direction": None,
-                "max_strength_score": Decimal("0"),
+                "max_strength_score": _ZERO,
             }
         
-        # Get strongest on each side
-        strongest_bid = self.get_strongest_broken_density(symbol, OrderSide.BID)
-        strongest_ask = self.get_strongest_broken_density(symbol, OrderSide.ASK)
-        
-        # Calculate strength scores for all broken densities
-        density_scores = [
-            {
-                "density": d,
-                "strength_score": self.calculate_breakout_strength(d),
-                "direction": self.get_breakout_direction(d),
-            }
-            for d in broken
-        ]
-        
-        # Find the strongest overall
-        if density_scores:
-            strongest_overall = max(density_scores, key=lambda x: x["strength_score"])
-            recommended_direction = strongest_overall["direction"]
-            max_strength = strongest_overall["strength_score"]
-        else:
-            recommended_direction = None
-            max_strength = Decimal("0")
+        # Single pass: per-side counts and strongest, scores, and overall best
+        bid_count = 0
+        ask_count = 0
+        strongest_bid: Optional[Density] = None
+        strongest_ask: Optional[Density] = None
+        bid_erosion = _ZERO
+        ask_erosion = _ZERO
+        density_scores = []
+        recommended_direction = None
+        max_strength = _ZERO
+
+        for d in broken:
+            erosion = d.erosion_percent()
+            if d.side == OrderSide.BID:
+                bid_count += 1
+                if strongest_bid is None or erosion > bid_erosion:
+                    strongest_bid, bid_erosion = d, erosion
+            else:
+                ask_count += 1
+                if strongest_ask is None or erosion > ask_erosion:
+                    strongest_ask, ask_erosion = d, erosion
+
+            score = self.calculate_breakout_strength(d)
+            direction = self.get_breakout_direction(d)
+            density_scores.append(
+                {
+                    "density": d,
+                    "strength_score": score,
+                    "direction": direction,
+                }
+            )
+
+            # Strict comparison keeps the first density on ties
+            if recommended_direction is None or score > max_strength:
+                recommended_direction = direction
+                max_strength = score
         
         analysis = {
             "symbol": symbol,
@@ -306,10 +367,10 @@ class DensityAnalyzer:
             "broken_densities_analysis_complete",
             symbol=symbol,
             broken_count=len(broken),
-            bid_broken=len([d for d in broken if d.side == OrderSide.BID]),
-            ask_broken=len([d for d in broken if d.side == OrderSide.ASK]),
+            bid_broken=bid_count,
+            ask_broken=ask_count,
             recommended_direction=recommended_direction,
-            max_strength_score=float(max_strength),
+            max_strength_score=max_strength,
         )
         
         return analysis
@@ -323,6 +384,10 @@ class DensityAnalyzer:
         """
         old_threshold = self.erosion_threshold_percent
         self.erosion_threshold_percent = new_threshold
+
+        # Cached results were computed against the old threshold
+        self._last_broken.clear()
+        self._strongest_broken.clear()
         
         self.logger.info(
             "erosion_threshold_updated",
@@ -6,12 +6,14 @@ combining breakout and bounce strategies to identify trading opportunities
 that align with the current market trend.
 """
 
+import asyncio
+import logging
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.storage.models import (
     Signal, SignalType, TrendDirection, OrderSide, PositionDirection,
-    OrderBook, Density, CoinParameters
+    OrderBook, Density, CoinParameters, StrategyFlags, PRICE_SCALE
 )
 from src.market_analysis.trend_analyzer import TrendAnalyzer
 from src.market_analysis.density_analyzer import DensityAnalyzer
@@ -22,6 +24,15 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_HUNDRED = Decimal(100)
+
+# Signal priorities (clusters rank above single levels)
+_PRIORITY_CLUSTER = Decimal("2.0")
+_PRIORITY_DEFAULT = Decimal("1.0")
+
+# Capture a traceback for one in every N errors unless DEBUG is enabled
+_EXC_INFO_SAMPLE_EVERY = 100
+
 
 def is_price_near_level_decimal(
     price: Decimal,
@@ -39,11 +50,11 @@ def is_price_near_level_decimal(
     Returns:
         True if price is within tolerance of level
     """
-    if level == 0:
+    if level <= 0:
         return False
 
-    diff_percent = abs((price - level) / level) * Decimal("100")
-    return diff_percent <= tolerance_percent
+    # |price - level| / level * 100 <= tolerance, cross-multiplied (level > 0)
+    return abs(price - level) * _HUNDRED <= tolerance_percent * level
 
 
 class SignalGenerator:
@@ -75,9 +86,35 @@ class SignalGenerator:
         self.trend_analyzer = trend_analyzer
         self.density_analyzer = density_analyzer
         self.logger = get_logger(__name__)
+        self._error_count = 0
+
+        # Bind per-tick lookups once; the params cache exists after db connect
+        cache = db_manager.coin_params_cache
+        self._get_params = cache.get_sync if cache else self._get_params_unbound
+        self._get_orderbook = orderbook_manager.get_current_orderbook
+        self._get_stable_densities = orderbook_manager.get_current_densities_by_erosion
 
         self.logger.info("signal_generator_initialized")
 
+    def _get_params_unbound(self, symbol: str) -> Optional[CoinParameters]:
+        """Look up coin parameters when the cache wasn't ready at init."""
+        return self.db_manager.coin_params_cache.get_sync(symbol)
+
+    def _exc_info(self) -> bool:
+        """
+        Decide whether an error log should capture a traceback.
+
+        Tracebacks are always captured at DEBUG level; otherwise only a
+        sample of errors pays for walking the stack.
+
+        Returns:
+            True if the traceback should be attached
+        """
+        self._error_count += 1
+        if logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
+            return True
+        return self._error_count % _EXC_INFO_SAMPLE_EVERY == 1
+
     async def generate_signals(self, symbol: str) -> List[Signal]:
         """
         Generate trading signals for a symbol.
@@ -95,83 +132,239 @@ class SignalGenerator:
             List of signals (can be empty)
         """
         try:
-            # Get current data
-            orderbook = self.orderbook_manager.get_current_orderbook(symbol)
-            params = self.db_manager.coin_params_cache.get_sync(symbol)
-
-            if not orderbook:
-                self.logger.debug(
-                    "no_orderbook_available",
-                    symbol=symbol,
-                    message="Cannot generate signals without orderbook"
-                )
-                return []
-
-            if not params:
-                self.logger.warning(
-                    "no_coin_parameters",
-                    symbol=symbol,
-                    message="Cannot generate signals without parameters"
-                )
-                return []
-
-            if not params.enabled:
-                self.logger.debug(
-                    "symbol_disabled",
-                    symbol=symbol,
-                    message="Trading disabled for this symbol"
-                )
+            inputs = self._get_signal_inputs(symbol)
+            if not inputs:
                 return []
+            orderbook, params = inputs
 
             # Analyze trend
             trend = await self.trend_analyzer.analyze_trend(symbol, orderbook)
 
-            if trend == TrendDirection.SIDEWAYS:
-                # Don't trade in neutral/sideways markets
-                self.logger.debug(
-                    "sideways_market",
-                    symbol=symbol,
-                    message="No signals in sideways market"
-                )
-                return []
+            return await self._generate_for_trend(symbol, orderbook, params, trend)
 
-            signals = []
+        except Exception as e:
+            self.logger.error(
+                "signal_generation_failed",
+                symbol=symbol,
+                error=str(e),
+                exc_info=self._exc_info()
+            )
+            return []
 
-            # Generate signals based on preferred strategy
-            if params.preferred_strategy in ["breakout", "both"]:
-                breakout_signal = await self._check_breakout_strategy(
-                    symbol, orderbook, params, trend
-                )
-                if breakout_signal:
-                    signals.append(breakout_signal)
+    async def generate_signals_batch(
+        self, symbols: List[str]
+    ) -> Dict[str, List[Signal]]:
+        """
+        Generate trading signals for several symbols at once.
 
-            if params.preferred_strategy in ["bounce", "both"]:
-                bounce_signal = await self._check_bounce_strategy(
-                    symbol, orderbook, params, trend
-                )
-                if bounce_signal:
-                    signals.append(bounce_signal)
-
-            if signals:
-                self.logger.info(
-                    "signals_generated",
-                    symbol=symbol,
-                    count=len(signals),
-                    trend=trend.value,
-                    strategy=params.preferred_strategy
-                )
+        Market stats for all symbols are fetched in a single query, then
+        per-symbol strategy evaluation runs concurrently.
 
-            return signals
+        Args:
+            symbols: Trading symbols to analyze
+
+        Returns:
+            Mapping of symbol to its signals (symbols without signals included)
+        """
+        results: Dict[str, List[Signal]] = {symbol: [] for symbol in symbols}
+
+        try:
+            prepared: Dict[str, Tuple[OrderBook, CoinParameters]] = {}
+            for symbol in symbols:
+                inputs = self._get_signal_inputs(symbol)
+                if inputs:
+                    prepared[symbol] = inputs
+
+            if not prepared:
+                return results
+
+            trends = await self.trend_analyzer.analyze_trends_batch(
+                {symbol: orderbook for symbol, (orderbook, _) in prepared.items()}
+            )
+
+            async def generate(symbol: str) -> List[Signal]:
+                orderbook, params = prepared[symbol]
+                try:
+                    return await self._generate_for_trend(
+                        symbol, orderbook, params, trends[symbol]
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "signal_generation_failed",
+                        symbol=symbol,
+                        error=str(e),
+                        exc_info=self._exc_info()
+                    )
+                    return []
+
+            batch = await asyncio.gather(*(generate(symbol) for symbol in prepared))
+            results.update(zip(prepared, batch))
 
         except Exception as e:
             self.logger.error(
-                "signal_generation_failed",
-                symbol=symbol,
+                "signal_batch_generation_failed",
+                symbols=len(symbols),
                 error=str(e),
-                exc_info=True
+                exc_info=self._exc_info()
+            )
+
+        return results
+
+    def _get_signal_inputs(
+        self, symbol: str
+    ) -> Optional[Tuple[OrderBook, CoinParameters]]:
+        """
+        Get orderbook and parameters needed to generate signals for a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            (orderbook, params) tuple, or None if the symbol can't be traded now
+        """
+        orderbook = self._get_orderbook(symbol)
+        params = self._get_params(symbol)
+
+        if not orderbook:
+            self.logger.debug(
+                "no_orderbook_available",
+                symbol=symbol,
+                message="Cannot generate signals without orderbook"
+            )
+            return None
+
+        if not params:
+            self.logger.warning(
+                "no_coin_parameters",
+                symbol=symbol,
+                message="Cannot generate signals without parameters"
+            )
+            return None
+
+        if not params.enabled:
+            self.logger.debug(
+                "symbol_disabled",
+                symbol=symbol,
+                message="Trading disabled for this symbol"
+            )
+            return None
+
+        return orderbook, params
+
+    async def _generate_for_trend(
+        self,
+        symbol: str,
+        orderbook: OrderBook,
+        params: CoinParameters,
+        trend: TrendDirection,
+    ) -> List[Signal]:
+        """
+        Generate signals for a symbol once its trend is known.
+
+        Args:
+            symbol: Trading symbol
+            orderbook: Current orderbook
+            params: Coin parameters
+            trend: Current trend direction
+
+        Returns:
+            List of signals (can be empty)
+        """
+        if trend == TrendDirection.SIDEWAYS:
+            # Don't trade in neutral/sideways markets
+            self.logger.debug(
+                "sideways_market",
+                symbol=symbol,
+                message="No signals in sideways market"
             )
             return []
 
+        # Generate signals based on preferred strategy
+        flags = params.strategy_flags
+        signals = await self._evaluate_strategies(
+            symbol,
+            orderbook,
+            params,
+            trend,
+            breakout=bool(flags & StrategyFlags.BREAKOUT),
+            bounce=bool(flags & StrategyFlags.BOUNCE),
+        )
+
+        if signals:
+            self.logger.info(
+                "signals_generated",
+                symbol=symbol,
+                count=len(signals),
+                trend=trend,
+                strategy=params.preferred_strategy
+            )
+
+        return signals
+
+    async def _evaluate_strategies(
+        self,
+        symbol: str,
+        orderbook: OrderBook,
+        params: CoinParameters,
+        trend: TrendDirection,
+        breakout: bool = True,
+        bounce: bool = True,
+    ) -> List[Signal]:
+        """
+        Evaluate breakout and bounce strategies in a single pass.
+
+        Mid price and the trend-to-side mapping are resolved once and shared
+        by both strategies instead of being recomputed per strategy.
+
+        Args:
+            symbol: Trading symbol
+            orderbook: Current orderbook
+            params: Coin parameters
+            trend: Current trend direction
+            breakout: Whether to evaluate the breakout strategy
+            bounce: Whether to evaluate the bounce strategy
+
+        Returns:
+            List of signals (can be empty)
+        """
+        signals: List[Signal] = []
+
+        if trend == TrendDirection.UP:
+            direction = PositionDirection.LONG
+            # Breakout through resistance (ASK), bounce off support (BID)
+            broken_side, bounce_side = OrderSide.ASK, OrderSide.BID
+        elif trend == TrendDirection.DOWN:
+            direction = PositionDirection.SHORT
+            # Breakout through support (BID), bounce off resistance (ASK)
+            broken_side, bounce_side = OrderSide.BID, OrderSide.ASK
+        else:
+            return signals
+
+        current_price = orderbook.get_mid_price()
+        if not current_price:
+            self.logger.debug(
+                "no_mid_price",
+                symbol=symbol,
+                message="Cannot evaluate strategies without mid price"
+            )
+            return signals
+
+        if breakout:
+            signal = self._evaluate_breakout(
+                symbol, current_price, params, direction, broken_side
+            )
+            if signal:
+                signals.append(signal)
+
+        if bounce:
+            signal = self._evaluate_bounce(
+                symbol, current_price, params, direction, bounce_side
+            )
+            if signal:
+                signals.append(signal)
+
+        return signals
+
     async def _check_breakout_strategy(
         self,
         symbol: str,
@@ -195,27 +388,38 @@ class SignalGenerator:
         Returns:
             Breakout signal or None
         """
-        try:
-            # Get broken densities based on trend
-            if trend == TrendDirection.UP:
-                # Look for broken ASK density (resistance breakout)
-                density = self.density_analyzer.get_strongest_broken_density(
-                    symbol, OrderSide.ASK
-                )
-                if density and density.erosion_percent() >= params.breakout_erosion_percent:
-                    return self._create_breakout_signal(
-                        symbol, density, PositionDirection.LONG, orderbook, params
-                    )
+        signals = await self._evaluate_strategies(
+            symbol, orderbook, params, trend, breakout=True, bounce=False
+        )
+        return signals[0] if signals else None
+
+    def _evaluate_breakout(
+        self,
+        symbol: str,
+        current_price: Decimal,
+        params: CoinParameters,
+        direction: PositionDirection,
+        side: OrderSide,
+    ) -> Optional[Signal]:
+        """
+        Look for the strongest broken density on one side of the book.
+
+        Args:
+            symbol: Trading symbol
+            current_price: Current mid price
+            params: Coin parameters
+            direction: Signal direction for this trend
+            side: Side whose broken densities trigger a breakout
 
-            elif trend == TrendDirection.DOWN:
-                # Look for broken BID density (support breakout)
-                density = self.density_analyzer.get_strongest_broken_density(
-                    symbol, OrderSide.BID
+        Returns:
+            Breakout signal or None
+        """
+        try:
+            density = self.density_analyzer.get_strongest_broken_density(symbol, side)
+            if density and density.erosion_cached >= float(params.breakout_erosion_percent):
+                return self._create_breakout_signal(
+                    symbol, density, direction, current_price, params
                 )
-                if density and density.erosion_percent() >= params.breakout_erosion_percent:
-                    return self._create_breakout_signal(
-                        symbol, density, PositionDirection.SHORT, orderbook, params
-                    )
 
             return None
 
@@ -224,7 +428,7 @@ class SignalGenerator:
                 "breakout_strategy_check_failed",
                 symbol=symbol,
                 error=str(e),
-                exc_info=True
+                exc_info=self._exc_info()
             )
             return None
 
@@ -233,7 +437,7 @@ class SignalGenerator:
         symbol: str,
         density: Density,
         direction: PositionDirection,
-        orderbook: OrderBook,
+        current_price: Decimal,
         params: CoinParameters,
     ) -> Signal:
         """
@@ -248,32 +452,25 @@ class SignalGenerator:
             symbol: Trading symbol
             density: Broken density that triggered signal
             direction: LONG or SHORT
-            orderbook: Current orderbook
+            current_price: Current mid price (entry)
             params: Coin parameters
 
         Returns:
             Breakout signal
         """
-        current_price = orderbook.get_mid_price()
-        if not current_price:
-            raise ValueError("Cannot get mid price from orderbook")
-
         # Calculate stop-loss behind broken density
         if direction == PositionDirection.LONG:
             # Stop below broken resistance
-            stop_loss = density.price_level * (
-                Decimal("1") - params.breakout_min_stop_loss_percent / Decimal("100")
-            )
+            stop_loss = density.price_level * params.breakout_sl_mul_long
         else:
             # Stop above broken support
-            stop_loss = density.price_level * (
-                Decimal("1") + params.breakout_min_stop_loss_percent / Decimal("100")
-            )
+            stop_loss = density.price_level * params.breakout_sl_mul_short
 
         # Priority based on cluster status
-        priority = Decimal("2.0") if density.is_cluster else Decimal("1.0")
+        priority = _PRIORITY_CLUSTER if density.is_cluster else _PRIORITY_DEFAULT
 
-        signal = Signal(
+        # All fields are built internally from validated models
+        signal = Signal.model_construct(
             symbol=symbol,
             type=SignalType.BREAKOUT,
             direction=direction,
@@ -286,11 +483,11 @@ class SignalGenerator:
         self.logger.info(
             "breakout_signal_generated",
             symbol=symbol,
-            direction=direction.value,
-            entry=float(current_price),
-            stop_loss=float(stop_loss),
-            density_level=float(density.price_level),
-            density_erosion=float(density.erosion_percent()),
+            direction=direction,
+            entry=current_price,
+            stop_loss=stop_loss,
+            density_level=density.price_level,
+            density_erosion=density.erosion_cached,
             is_cluster=density.is_cluster,
             priority="HIGH" if density.is_cluster else "MEDIUM",
         )
@@ -317,64 +514,56 @@ class SignalGenerator:
             params: Coin parameters
             trend: Current trend direction
 
+        Returns:
+            Bounce signal or None
+        """
+        signals = await self._evaluate_strategies(
+            symbol, orderbook, params, trend, breakout=False, bounce=True
+        )
+        return signals[0] if signals else None
+
+    def _evaluate_bounce(
+        self,
+        symbol: str,
+        current_price: Decimal,
+        params: CoinParameters,
+        direction: PositionDirection,
+        side: OrderSide,
+    ) -> Optional[Signal]:
+        """
+        Look for a stable density on one side that price is touching.
+
+        Args:
+            symbol: Trading symbol
+            current_price: Current mid price
+            params: Coin parameters
+            direction: Signal direction for this trend
+            side: Side whose densities act as support/resistance
+
         Returns:
             Bounce signal or None
         """
         try:
-            current_price = orderbook.get_mid_price()
-            if not current_price:
-                self.logger.debug(
-                    "no_mid_price",
-                    symbol=symbol,
-                    message="Cannot check bounce without mid price"
-                )
-                return None
-
-            densities = self.orderbook_manager.get_current_densities(symbol)
-
-            if trend == TrendDirection.UP:
-                # Look for price near BID density (support bounce)
-                for density in densities:
-                    if density.side != OrderSide.BID:
-                        continue
-
-                    # Check if price is touching density
-                    if not is_price_near_level_decimal(
-                        current_price,
-                        density.price_level,
-                        params.bounce_touch_tolerance_percent
-                    ):
-                        continue
-
-                    # Check if density is stable (low erosion)
-                    if density.erosion_percent() >= params.bounce_density_stable_percent:
-                        continue
-
-                    # Generate LONG bounce signal
-                    return self._create_bounce_signal(
-                        symbol, density, PositionDirection.LONG, params
-                    )
+            # Least eroded first, so the first unstable density ends the scan
+            densities = self._get_stable_densities(symbol, side)
 
-            elif trend == TrendDirection.DOWN:
-                # Look for price near ASK density (resistance bounce)
-                for density in densities:
-                    if density.side != OrderSide.ASK:
-                        continue
-
-                    if not is_price_near_level_decimal(
-                        current_price,
-                        density.price_level,
-                        params.bounce_touch_tolerance_percent
-                    ):
-                        continue
-
-                    if density.erosion_percent() >= params.bounce_density_stable_percent:
-                        continue
-
-                    # Generate SHORT bounce signal
-                    return self._create_bounce_signal(
-                        symbol, density, PositionDirection.SHORT, params
-                    )
+            # Touch check runs per density in fixed-point integers:
+            # |price - level| * 100 <= tolerance% * level, both sides scaled
+            price_s = int(current_price * PRICE_SCALE)
+            tolerance_s = int(params.bounce_touch_tolerance_percent * PRICE_SCALE)
+            stable_f = float(params.bounce_density_stable_percent)
+
+            for density in densities:
+                # Check if density is stable (low erosion)
+                if density.erosion_cached >= stable_f:
+                    break
+
+                # Check if price is touching density
+                level_s = density.price_scaled
+                if abs(price_s - level_s) * 100 * PRICE_SCALE > tolerance_s * level_s:
+                    continue
+
+                return self._create_bounce_signal(symbol, density, direction, params)
 
             return None
 
@@ -383,7 +572,7 @@ class SignalGenerator:
                 "bounce_strategy_check_failed",
                 symbol=symbol,
                 error=str(e),
-                exc_info=True
+                exc_info=self._exc_info()
             )
             return None
 
@@ -416,33 +605,30 @@ class SignalGenerator:
         # Calculate stop-loss behind density
         if direction == PositionDirection.LONG:
             # Stop below support
-            stop_loss = density.price_level * (
-                Decimal("1") - params.bounce_stop_loss_behind_density_percent / Decimal("100")
-            )
+            stop_loss = density.price_level * params.bounce_sl_mul_long
         else:
             # Stop above resistance
-            stop_loss = density.price_level * (
-                Decimal("1") + params.bounce_stop_loss_behind_density_percent / Decimal("100")
-            )
+            stop_loss = density.price_level * params.bounce_sl_mul_short
 
-        signal = Signal(
+        # All fields are built internally from validated models
+        signal = Signal.model_construct(
             symbol=symbol,
             type=SignalType.BOUNCE,
             direction=direction,
             entry_price=entry_price,
             stop_loss=stop_loss,
             density=density,
-            priority=Decimal("1.0"),  # MEDIUM priority
+            priority=_PRIORITY_DEFAULT,  # MEDIUM priority
         )
 
         self.logger.info(
             "bounce_signal_generated",
             symbol=symbol,
-            direction=direction.value,
-            entry=float(entry_price),
-            stop_loss=float(stop_loss),
-            density_level=float(density.price_level),
-            density_volume_percent=float(density.volume_percent) if density.volume_percent else None,
+            direction=direction,
+            entry=entry_price,
+            stop_loss=stop_loss,
+            density_level=density.price_level,
+            density_volume_percent=density.volume_percent,
             is_cluster=density.is_cluster,
             priority="MEDIUM",
         )
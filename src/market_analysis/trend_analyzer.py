@@ -8,8 +8,11 @@ This module analyzes market trends using two criteria:
 Both criteria must agree for a directional trend determination.
 """
 
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
+
+import numpy as np
 
 from src.storage.models import OrderBook, TrendDirection, OrderSide
 from src.storage.db_manager import DatabaseManager
@@ -21,6 +24,44 @@ from src.utils.types import (
 
 logger = get_logger(__name__)
 
+_ONE = Decimal(1)
+
+# Return codes of _pressure_trend
+_PRESSURE_TRENDS = {
+    1: TrendDirection.UP,
+    -1: TrendDirection.DOWN,
+    0: TrendDirection.SIDEWAYS,
+}
+
+
+def _pressure_trend(
+    bid_volumes: np.ndarray,
+    ask_volumes: np.ndarray,
+    up_ratio: float,
+    down_ratio: float,
+) -> int:
+    """
+    Classify bid/ask pressure from raw volume arrays in one pass.
+
+    Args:
+        bid_volumes: Bid level volumes (float64)
+        ask_volumes: Ask level volumes (float64)
+        up_ratio: Bid/ask ratio at or above which pressure is up
+        down_ratio: Bid/ask ratio at or below which pressure is down
+
+    Returns:
+        1 for up, -1 for down, 0 for sideways (or zero ask volume)
+    """
+    ask_total = ask_volumes.sum()
+    if ask_total == 0.0:
+        return 0
+    ratio = bid_volumes.sum() / ask_total
+    if ratio >= up_ratio:
+        return 1
+    if ratio <= down_ratio:
+        return -1
+    return 0
+
 
 class TrendAnalyzer:
     """
@@ -35,6 +76,8 @@ class TrendAnalyzer:
         db_manager: DatabaseManager,
         price_change_threshold: Decimal = Decimal(str(DEFAULT_TREND_PRICE_CHANGE_THRESHOLD)),
         orderbook_pressure_ratio: Decimal = Decimal(str(DEFAULT_TREND_ORDERBOOK_PRESSURE_RATIO)),
+        stats_ttl_seconds: float = 5.0,
+        trend_ttl_seconds: float = 1.0,
     ):
         """
         Initialize the trend analyzer.
@@ -43,13 +86,27 @@ class TrendAnalyzer:
             db_manager: Database manager instance for querying market stats
             price_change_threshold: Minimum 24h price change % for trend (default: 2.0%)
             orderbook_pressure_ratio: Bid/ask ratio threshold for trend (default: 1.2)
+            stats_ttl_seconds: How long fetched market stats are reused (default: 5s)
+            trend_ttl_seconds: How long a computed trend is reused (default: 1s)
         """
         self.db_manager = db_manager
         self.price_change_threshold = price_change_threshold
         self.orderbook_pressure_ratio = orderbook_pressure_ratio
 
         # Calculate the inverse ratio for downtrend (1/1.2 ≈ 0.83)
-        self.orderbook_pressure_ratio_inverse = Decimal("1") / orderbook_pressure_ratio
+        self.orderbook_pressure_ratio_inverse = _ONE / orderbook_pressure_ratio
+
+        # Float thresholds for the pressure ratio comparison
+        self._pressure_up_f = float(self.orderbook_pressure_ratio)
+        self._pressure_down_f = float(self.orderbook_pressure_ratio_inverse)
+
+        # 24h stats change slowly; cache per symbol as (fetched_at, row)
+        self.stats_ttl_seconds = stats_ttl_seconds
+        self._stats_cache: dict[str, tuple[float, Any]] = {}
+
+        # Computed trends per symbol as (trend, expires_at)
+        self.trend_ttl_seconds = trend_ttl_seconds
+        self._trend_cache: dict[str, tuple[TrendDirection, float]] = {}
 
         logger.info(
             "trend_analyzer_initialized",
@@ -64,6 +121,8 @@ class TrendAnalyzer:
         """
         Analyze current trend for a symbol.
 
+        Results are reused for trend_ttl_seconds.
+
         Args:
             symbol: Trading symbol (e.g., BTCUSDT)
             orderbook: Current order book snapshot
@@ -71,14 +130,85 @@ class TrendAnalyzer:
         Returns:
             TrendDirection.UP, DOWN, or SIDEWAYS
         """
+        now = time.monotonic()
+        cached = self._trend_cache.get(symbol)
+        if cached and cached[1] > now:
+            return cached[0]
+
         # 1. Get 24h stats from database
         stats = await self._get_market_stats(symbol)
+        trend = self._evaluate_trend(symbol, stats, orderbook)
+        self._trend_cache[symbol] = (trend, now + self.trend_ttl_seconds)
+        return trend
+
+    async def analyze_trends_batch(
+        self, orderbooks: dict[str, OrderBook]
+    ) -> dict[str, TrendDirection]:
+        """
+        Analyze current trends for several symbols.
+
+        Trends still within their TTL are reused; market stats missing from
+        the cache are fetched in a single query.
+
+        Args:
+            orderbooks: Current order book snapshot per symbol
+
+        Returns:
+            TrendDirection per symbol
+        """
+        now = time.monotonic()
+        trends: dict[str, TrendDirection] = {}
+        pending: dict[str, OrderBook] = {}
+        for symbol, orderbook in orderbooks.items():
+            cached = self._trend_cache.get(symbol)
+            if cached and cached[1] > now:
+                trends[symbol] = cached[0]
+            else:
+                pending[symbol] = orderbook
+
+        if pending:
+            stats_by_symbol = await self._get_market_stats_batch(list(pending))
+            expires_at = now + self.trend_ttl_seconds
+            for symbol, orderbook in pending.items():
+                trend = self._evaluate_trend(symbol, stats_by_symbol.get(symbol), orderbook)
+                self._trend_cache[symbol] = (trend, expires_at)
+                trends[symbol] = trend
+
+        return trends
+
+    def _evaluate_trend(
+        self, symbol: str, stats: Any, orderbook: OrderBook
+    ) -> TrendDirection:
+        """
+        Determine trend from market stats and order book.
+
+        Args:
+            symbol: Trading symbol
+            stats: Market stats record with price_change_24h_percent first
+                (or None if unavailable)
+            orderbook: Current order book snapshot
+
+        Returns:
+            TrendDirection.UP, DOWN, or SIDEWAYS
+        """
         if not stats:
             logger.warning("no_market_stats", symbol=symbol)
             return TrendDirection.SIDEWAYS
 
-        # 2. Analyze 24h price change
-        price_trend = self._analyze_price_change(stats['price_change_24h_percent'])
+        # 2. Analyze 24h price change (first selected column)
+        price_change = stats[0]
+        price_trend = self._analyze_price_change(price_change)
+
+        # Both criteria must agree, so a sideways price trend is final
+        if price_trend == TrendDirection.SIDEWAYS:
+            logger.debug(
+                "trend_analyzed",
+                symbol=symbol,
+                price_change=price_change,
+                price_trend=price_trend,
+                final_trend=price_trend,
+            )
+            return TrendDirection.SIDEWAYS
 
         # 3. Analyze order book pressure
         orderbook_trend = self._analyze_orderbook_pressure(orderbook)
@@ -89,10 +219,10 @@ class TrendAnalyzer:
         logger.info(
             "trend_analyzed",
             symbol=symbol,
-            price_change=float(stats['price_change_24h_percent']),
-            price_trend=price_trend.value,
-            orderbook_trend=orderbook_trend.value,
-            final_trend=final_trend.value,
+            price_change=price_change,
+            price_trend=price_trend,
+            orderbook_trend=orderbook_trend,
+            final_trend=final_trend,
         )
 
         return final_trend
@@ -101,18 +231,59 @@ class TrendAnalyzer:
         """
         Get market statistics for a symbol from the database.
 
+        Rows are reused for stats_ttl_seconds before being fetched again.
+
         Args:
             symbol: Trading symbol
 
         Returns:
-            Database record with market stats or None if not found
+            Record holding price_change_24h_percent, or None if not found
         """
+        now = time.monotonic()
+        cached = self._stats_cache.get(symbol)
+        if cached and now - cached[0] < self.stats_ttl_seconds:
+            return cached[1]
+
         row = await self.db_manager.fetchrow(
-            "SELECT * FROM market_stats WHERE symbol = $1",
+            "SELECT price_change_24h_percent FROM market_stats WHERE symbol = $1",
             symbol
         )
+        if row:
+            self._stats_cache[symbol] = (now, row)
         return row
 
+    async def _get_market_stats_batch(self, symbols: list[str]) -> dict[str, Any]:
+        """
+        Get market statistics for several symbols with at most one query.
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Mapping of symbol to market stats record (missing symbols omitted)
+        """
+        now = time.monotonic()
+        result: dict[str, Any] = {}
+        stale: list[str] = []
+        for symbol in symbols:
+            cached = self._stats_cache.get(symbol)
+            if cached and now - cached[0] < self.stats_ttl_seconds:
+                result[symbol] = cached[1]
+            else:
+                stale.append(symbol)
+
+        if stale:
+            rows = await self.db_manager.fetch(
+                "SELECT price_change_24h_percent, symbol FROM market_stats "
+                "WHERE symbol = ANY($1::text[])",
+                stale
+            )
+            for row in rows:
+                self._stats_cache[row[1]] = (now, row)
+                result[row[1]] = row
+
+        return result
+
     def _analyze_price_change(self, price_change_percent: Decimal) -> TrendDirection:
         """
         Analyze 24h price change to determine trend.
@@ -148,29 +319,23 @@ class TrendAnalyzer:
             TrendDirection.DOWN if ratio <= 0.83 (20% more asks than bids)
             TrendDirection.SIDEWAYS otherwise
         """
-        # Calculate total volumes for each side
-        bid_volume = orderbook.get_total_volume(OrderSide.BID)
-        ask_volume = orderbook.get_total_volume(OrderSide.ASK)
-
         # Handle edge case: zero ask volume (avoid division by zero)
-        if ask_volume == 0:
+        if not orderbook.asks:
             logger.warning(
                 "zero_ask_volume",
                 symbol=orderbook.symbol,
-                bid_volume=float(bid_volume),
+                bid_volume=orderbook.get_total_volume_float(OrderSide.BID),
             )
             return TrendDirection.SIDEWAYS
 
-        # Calculate bid/ask ratio
-        pressure_ratio = bid_volume / ask_volume
-
-        # Determine trend based on ratio
-        if pressure_ratio >= self.orderbook_pressure_ratio:
-            return TrendDirection.UP
-        elif pressure_ratio <= self.orderbook_pressure_ratio_inverse:
-            return TrendDirection.DOWN
-        else:
-            return TrendDirection.SIDEWAYS
+        # Sum both sides and compare the ratio in a single kernel call
+        code = _pressure_trend(
+            orderbook.get_volume_array(OrderSide.BID),
+            orderbook.get_volume_array(OrderSide.ASK),
+            self._pressure_up_f,
+            self._pressure_down_f,
+        )
+        return _PRESSURE_TRENDS[code]
 
     def _combine_trends(
         self, price_trend: TrendDirection, orderbook_trend: TrendDirection
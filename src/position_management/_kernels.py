@@ -0,0 +1,112 @@
+"""
+Numeric kernels for position monitoring.
+
+Plain functions over float64 arrays and floats, kept free of models and
+logging so the take-profit checks stay simple, allocation-light numpy code.
+"""
+
+import math
+
+import numpy as np
+
+# Slack for float rounding when comparing profit against a threshold, in bps.
+# Far below one price tick, so only prices exactly at the threshold are affected
+_BPS_TOLERANCE = 1e-6
+
+
+def velocity(timestamps: np.ndarray, prices: np.ndarray, cutoff: float) -> float:
+    """
+    Calculate price velocity (% change per second) since a cutoff time.
+
+    Args:
+        timestamps: Sample times in seconds (ascending)
+        prices: Prices matching timestamps
+        cutoff: Start of the window, same clock as timestamps
+
+    Returns:
+        Absolute velocity as % change per second (0.0 if not enough data)
+    """
+    count = len(timestamps)
+    if count < 2:
+        return 0.0
+
+    start = int(np.searchsorted(timestamps, cutoff))
+    if count - start < 2:
+        return 0.0
+
+    # First and last price in window
+    first_price = prices[start]
+    time_diff = timestamps[-1] - timestamps[start]
+
+    if time_diff == 0.0 or first_price == 0.0:
+        return 0.0
+
+    # % change per second
+    return float(abs((prices[-1] - first_price) / first_price * 100.0 / time_diff))
+
+
+def mean_imbalance(bid_volumes: np.ndarray, ask_volumes: np.ndarray) -> float:
+    """
+    Calculate the average bid/ask volume ratio over samples with ask volume.
+
+    Args:
+        bid_volumes: Bid volume samples
+        ask_volumes: Ask volume samples
+
+    Returns:
+        Mean bid/ask ratio, or NaN if no sample has ask volume
+    """
+    mask = ask_volumes > 0.0
+    if not mask.any():
+        return math.nan
+    return float((bid_volumes[mask] / ask_volumes[mask]).mean())
+
+
+def profit_bps(
+    current_prices: np.ndarray,
+    entry_prices: np.ndarray,
+    direction_signs: np.ndarray,
+    leverages: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate leveraged profit in basis points for many positions at once.
+
+    Args:
+        current_prices: Current prices (NaN where unavailable)
+        entry_prices: Entry prices
+        direction_signs: +1.0 for LONG, -1.0 for SHORT
+        leverages: Leverage multipliers
+
+    Returns:
+        Profit per position in basis points (NaN where price is NaN)
+    """
+    return direction_signs * (current_prices - entry_prices) / entry_prices * (
+        10_000.0 * leverages
+    )
+
+
+def breakeven_mask(
+    current_prices: np.ndarray,
+    entry_prices: np.ndarray,
+    direction_signs: np.ndarray,
+    leverages: np.ndarray,
+    thresholds_bps: np.ndarray,
+    pending: np.ndarray,
+) -> np.ndarray:
+    """
+    Decide which positions have reached their breakeven profit threshold.
+
+    Args:
+        current_prices: Current prices (NaN where unavailable)
+        entry_prices: Entry prices
+        direction_signs: +1.0 for LONG, -1.0 for SHORT
+        leverages: Leverage multipliers
+        thresholds_bps: Breakeven profit threshold per position, in basis points
+        pending: Positions still eligible for a breakeven move
+
+    Returns:
+        Boolean mask of positions to move to breakeven (False where price is NaN)
+    """
+    profits = profit_bps(current_prices, entry_prices, direction_signs, leverages)
+    # A price exactly at the threshold counts as reached, as in the Decimal check
+    return pending & (profits >= thresholds_bps - _BPS_TOLERANCE)
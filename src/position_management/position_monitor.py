@@ -9,11 +9,20 @@ This module manages the lifecycle of open positions, including:
 - Determining when to close positions
 """
 
+import asyncio
+import logging
+import math
+import time
+from bisect import bisect_left, bisect_right
 from decimal import Decimal
-from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Callable, List, NamedTuple, Optional
+from uuid import UUID
+
+import numpy as np
 
 from src.storage.models import (
+    Density,
+    OrderBook,
     Position,
     PositionStatus,
     SignalType,
@@ -24,8 +33,27 @@ from src.storage.models import (
 )
 from src.storage.db_manager import DatabaseManager
 from src.data_collection.orderbook_manager import OrderBookManager
+from src.trading_execution.order_executor import OrderExecutor
+from src.position_management import _kernels
 from src.utils.logger import get_logger
 
+# Capture a traceback for one in every N check errors unless DEBUG is enabled
+_EXC_INFO_SAMPLE_EVERY = 100
+
+# Pending exchange stop-loss updates before new submissions are rejected
+_SL_QUEUE_SIZE = 100
+
+
+class _DirectionChecks(NamedTuple):
+    """Direction-specific pieces of the exit checks, bound per position."""
+
+    # (symbol, current_price, max_distance_percent) -> nearest counter density or None
+    find_counter_density: Callable[[str, Decimal, float], Optional[Density]]
+    # (current_imbalance, avg_imbalance, threshold) -> reversal detected
+    is_imbalance_reversed: Callable[[float, float, float], bool]
+    # (current_price, density_price) -> price back inside the range
+    is_back_in_range: Callable[[float, float], bool]
+
 
 class PositionMonitor:
     """
@@ -43,6 +71,7 @@ class PositionMonitor:
         self,
         db_manager: DatabaseManager,
         orderbook_manager: OrderBookManager,
+        order_executor: Optional[OrderExecutor] = None,
         check_interval_seconds: int = 5,
     ):
         """
@@ -51,56 +80,211 @@ class PositionMonitor:
         Args:
             db_manager: Database manager for persistence
             orderbook_manager: OrderBook manager for market data
+            order_executor: Executor for exchange stop-loss updates
+                (None = only update stop-loss in memory)
             check_interval_seconds: How often to check positions (default: 5 seconds)
         """
         self.db_manager = db_manager
         self.orderbook_manager = orderbook_manager
+        self.order_executor = order_executor
         self.check_interval_seconds = check_interval_seconds
         self.logger = get_logger(__name__)
+        self._stdlib_logger = logging.getLogger(__name__)
+        self._error_count = 0
 
-        # Track positions to avoid duplicate processing
+        # Track positions to avoid duplicate processing. Copy-on-write: the
+        # dict is never mutated in place, only replaced on start/stop, so
+        # readers can hold a reference safely across awaits
         self._monitored_positions: dict[str, Position] = {}
 
+        # Immutable views of monitored positions, replaced on start/stop
+        self._snapshot: tuple[tuple[str, Position], ...] = ()
+        self._symbols_snapshot: tuple[str, ...] = ()
+
+        # Per-position arrays aligned with _snapshot (structure of arrays)
+        self._entry_prices = np.empty(0)
+        self._direction_signs = np.empty(0)
+        self._leverages = np.empty(0)
+
+        # Velocities per symbol as (orderbook sequence, short, long)
+        self._velocity_cache: dict[str, tuple[int, float, float]] = {}
+
+        # Orderbook sequence each symbol was last checked at without errors
+        self._last_checked_sequence: dict[str, int] = {}
+
+        # Direction-specific checks, bound per position at start_monitoring
+        self._long_checks = _DirectionChecks(
+            self._find_counter_density_long,
+            self._is_imbalance_reversed_long,
+            self._is_back_in_range_long,
+        )
+        self._short_checks = _DirectionChecks(
+            self._find_counter_density_short,
+            self._is_imbalance_reversed_short,
+            self._is_back_in_range_short,
+        )
+        self._direction_checks: dict[UUID, _DirectionChecks] = {}
+
+        # Strategy-specific breakeven check, bound per position at start_monitoring
+        self._breakeven_checks: dict[UUID, Callable[..., bool]] = {}
+
+        # Coin parameters per monitored symbol, refreshed by cache callbacks
+        self._params: dict[str, CoinParameters] = {}
+
+        # Breakeven stop-loss updates as (position, old_stop, new_stop),
+        # submitted to the exchange by a background worker
+        self._sl_submit_queue: asyncio.Queue[tuple[Position, Decimal, Decimal]] = (
+            asyncio.Queue(maxsize=_SL_QUEUE_SIZE)
+        )
+        self._sl_worker_task: Optional[asyncio.Task] = None
+
         self.logger.info(
             "position_monitor_initialized",
             check_interval=check_interval_seconds,
         )
 
-    def _calculate_velocity(
-        self, history: list[tuple[datetime, Decimal]], window_sec: int
-    ) -> Decimal:
+    async def start(self) -> None:
+        """Start the exchange stop-loss worker."""
+        if self.order_executor and self._sl_worker_task is None:
+            self._sl_worker_task = asyncio.create_task(self._sl_worker())
+
+    async def stop(self) -> None:
+        """Stop the exchange stop-loss worker."""
+        if self._sl_worker_task:
+            self._sl_worker_task.cancel()
+            try:
+                await self._sl_worker_task
+            except asyncio.CancelledError:
+                pass
+            self._sl_worker_task = None
+
+    async def _sl_worker(self) -> None:
+        """Submit queued stop-loss updates to the exchange and record them."""
+        while True:
+            position, old_stop, new_stop = await self._sl_submit_queue.get()
+            try:
+                await self._submit_stop_loss(position, old_stop, new_stop)
+            finally:
+                self._sl_submit_queue.task_done()
+
+    async def _submit_stop_loss(
+        self, position: Position, old_stop: Decimal, new_stop: Decimal
+    ) -> None:
         """
-        Calculate price velocity (% change per second) for a time window.
+        Move the exchange stop-loss and record it in the database.
+
+        If the exchange stop was not moved, the in-memory move is rolled back
+        so a later check retries it. Once the exchange accepted the new stop,
+        a failed database write does not roll anything back.
 
         Args:
-            history: List of (timestamp, price) tuples
-            window_sec: Time window in seconds
+            position: Position whose stop-loss is being moved
+            old_stop: Stop-loss before the move
+            new_stop: Stop-loss submitted to the exchange
+        """
+        try:
+            success = await self.order_executor.modify_stop_loss(
+                position.symbol, new_stop
+            )
+        except Exception as e:
+            self._rollback_breakeven(position, old_stop)
+            self.logger.error(
+                "stop_loss_worker_error",
+                symbol=position.symbol,
+                position_id=position.id,
+                error=str(e),
+                exc_info=True,
+            )
+            return
+
+        if not success:
+            self._rollback_breakeven(position, old_stop)
+            self.logger.warning(
+                "stop_loss_update_failed",
+                symbol=position.symbol,
+                position_id=position.id,
+                stop_loss=new_stop,
+            )
+            return
+
+        try:
+            await self.db_manager.update_trade_stop_loss(
+                position.id, new_stop, breakeven=True
+            )
+        except Exception as e:
+            # The exchange stop moved; only the trade record is stale
+            self.logger.error(
+                "stop_loss_db_update_failed",
+                symbol=position.symbol,
+                position_id=position.id,
+                stop_loss=new_stop,
+                error=str(e),
+                exc_info=True,
+            )
+            return
+
+        self.logger.info(
+            "stop_loss_update_confirmed",
+            symbol=position.symbol,
+            position_id=position.id,
+            stop_loss=new_stop,
+        )
+
+    def _rollback_breakeven(self, position: Position, old_stop: Decimal) -> None:
+        """
+        Undo an in-memory breakeven move so a later check retries it.
+
+        Args:
+            position: Position whose stop-loss move did not reach the exchange
+            old_stop: Stop-loss before the move
+        """
+        position.stop_loss = old_stop
+        position.breakeven_moved = False
+        # Force the next check even if the orderbook has not changed
+        self._last_checked_sequence.pop(position.symbol, None)
+
+    def _info_enabled(self) -> bool:
+        """
+        Check whether INFO events would be emitted.
+
+        Guards hot-path logs so filtered-out events skip building their
+        fields (and any values computed only for the log).
 
         Returns:
-            Velocity as % change per second
+            True if the INFO level is enabled
         """
-        if len(history) < 2:
-            return Decimal("0")
+        return self._stdlib_logger.isEnabledFor(logging.INFO)
 
-        cutoff_time = datetime.now() - timedelta(seconds=window_sec)
-        window_data = [(ts, price) for ts, price in history if ts >= cutoff_time]
+    def _exc_info(self) -> bool:
+        """
+        Decide whether a check error log should capture a traceback.
 
-        if len(window_data) < 2:
-            return Decimal("0")
+        Tracebacks are always captured at DEBUG level; otherwise only a
+        sample of errors pays for walking the stack.
 
-        # First and last price in window
-        first_price = window_data[0][1]
-        last_price = window_data[-1][1]
-        time_diff = (window_data[-1][0] - window_data[0][0]).total_seconds()
+        Returns:
+            True if the traceback should be attached
+        """
+        self._error_count += 1
+        if self._stdlib_logger.isEnabledFor(logging.DEBUG):
+            return True
+        return self._error_count % _EXC_INFO_SAMPLE_EVERY == 1
 
-        if time_diff == 0 or first_price == 0:
-            return Decimal("0")
+    def _calculate_velocity(
+        self, timestamps: np.ndarray, prices: np.ndarray, window_sec: int
+    ) -> float:
+        """
+        Calculate price velocity (% change per second) for a time window.
 
-        # % change per second
-        price_change_percent = ((last_price - first_price) / first_price) * Decimal("100")
-        velocity = price_change_percent / Decimal(str(time_diff))
+        Args:
+            timestamps: Sample times in monotonic seconds (ascending)
+            prices: Prices matching timestamps
+            window_sec: Time window in seconds
 
-        return abs(velocity)
+        Returns:
+            Velocity as % change per second
+        """
+        return _kernels.velocity(timestamps, prices, time.monotonic() - window_sec)
 
     def _check_velocity_slowdown(
         self, symbol: str, params: CoinParameters
@@ -118,30 +302,40 @@ class PositionMonitor:
             True if velocity slowdown detected
         """
         try:
-            # Get price history
-            history = self.orderbook_manager.get_price_history(symbol, seconds=20)
+            # Reuse velocities until a new orderbook update arrives
+            sequence = self.orderbook_manager.get_sequence(symbol)
+            cached = self._velocity_cache.get(symbol)
+            if cached and cached[0] == sequence:
+                _, short_velocity, long_velocity = cached
+            else:
+                # Get price history
+                timestamps, prices = self.orderbook_manager.get_price_history(
+                    symbol, seconds=20
+                )
 
-            if len(history) < 10:
-                return False
+                if len(timestamps) < 10:
+                    return False
 
-            # Calculate velocities
-            short_velocity = self._calculate_velocity(history, window_sec=3)
-            long_velocity = self._calculate_velocity(history, window_sec=15)
+                # Calculate velocities
+                short_velocity = self._calculate_velocity(timestamps, prices, window_sec=3)
+                long_velocity = self._calculate_velocity(timestamps, prices, window_sec=15)
+                self._velocity_cache[symbol] = (sequence, short_velocity, long_velocity)
 
-            if long_velocity == 0:
+            if long_velocity == 0.0:
                 return False
 
             # Get threshold from params (default 0.5 = 50%)
-            threshold = getattr(params, 'tp_velocity_slowdown_threshold', Decimal("0.5"))
+            threshold = params.tp_velocity_slowdown_threshold
 
             if short_velocity < long_velocity * threshold:
-                self.logger.info(
-                    "velocity_slowdown_detected",
-                    symbol=symbol,
-                    short_velocity=float(short_velocity),
-                    long_velocity=float(long_velocity),
-                    threshold=float(threshold),
-                )
+                if self._info_enabled():
+                    self.logger.info(
+                        "velocity_slowdown_detected",
+                        symbol=symbol,
+                        short_velocity=short_velocity,
+                        long_velocity=long_velocity,
+                        threshold=threshold,
+                    )
                 return True
 
             return False
@@ -151,59 +345,83 @@ class PositionMonitor:
                 "velocity_slowdown_check_error",
                 symbol=symbol,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._exc_info(),
             )
             return False
 
-    def _check_counter_density(self, position: Position) -> bool:
+    def _find_counter_density_long(
+        self, symbol: str, current_price: Decimal, max_distance_percent: float
+    ) -> Optional[Density]:
+        """Find the nearest ASK density above price (resistance) for a LONG position."""
+        # Per-side densities are sorted by price, so the nearest one above
+        # price is found by binary search
+        asks = self.orderbook_manager.get_current_densities_by_side(symbol, OrderSide.ASK)
+        index = bisect_right(asks, current_price, key=lambda d: d.price_level)
+        if index == len(asks):
+            return None
+        density = asks[index]
+        limit = float(current_price) * (1.0 + max_distance_percent / 100.0)
+        return density if float(density.price_level) <= limit else None
+
+    def _find_counter_density_short(
+        self, symbol: str, current_price: Decimal, max_distance_percent: float
+    ) -> Optional[Density]:
+        """Find the nearest BID density below price (support) for a SHORT position."""
+        bids = self.orderbook_manager.get_current_densities_by_side(symbol, OrderSide.BID)
+        index = bisect_left(bids, current_price, key=lambda d: d.price_level)
+        if index == 0:
+            return None
+        density = bids[index - 1]
+        limit = float(current_price) * (1.0 - max_distance_percent / 100.0)
+        return density if float(density.price_level) >= limit else None
+
+    def _check_counter_density(
+        self,
+        position: Position,
+        orderbook: OrderBook,
+        params: CoinParameters,
+        checks: _DirectionChecks,
+    ) -> bool:
         """
-        Check if a density exists in the direction of movement.
+        Check if a density stands close ahead in the direction of movement.
+
+        For LONG: nearest ASK density above current price
+        For SHORT: nearest BID density below current price
 
-        For LONG: check for ASK density above current price
-        For SHORT: check for BID density below current price
+        Only a density within tp_counter_density_distance_percent of the
+        current price counts; densities further out are not yet in the way.
 
         Args:
             position: Position to check
+            orderbook: Orderbook snapshot for this tick
+            params: CoinParameters with thresholds
+            checks: Direction-specific checks for the position
 
         Returns:
             True if counter density detected
         """
         try:
-            densities = self.orderbook_manager.get_current_densities(position.symbol)
-            orderbook = self.orderbook_manager.get_current_orderbook(position.symbol)
-
-            if not orderbook:
-                return False
-
             current_price = orderbook.get_mid_price()
             if not current_price:
                 return False
 
-            for density in densities:
-                if position.direction == PositionDirection.LONG:
-                    # Check for ASK density above price (resistance)
-                    if density.side.value == "ASK" and density.price_level > current_price:
-                        self.logger.info(
-                            "counter_density_detected",
-                            symbol=position.symbol,
-                            position_id=str(position.id),
-                            direction="LONG",
-                            density_price=float(density.price_level),
-                            current_price=float(current_price),
-                        )
-                        return True
-                else:
-                    # Check for BID density below price (support)
-                    if density.side.value == "BID" and density.price_level < current_price:
-                        self.logger.info(
-                            "counter_density_detected",
-                            symbol=position.symbol,
-                            position_id=str(position.id),
-                            direction="SHORT",
-                            density_price=float(density.price_level),
-                            current_price=float(current_price),
-                        )
-                        return True
+            max_distance = params.tp_counter_density_distance_percent
+            density = checks.find_counter_density(
+                position.symbol, current_price, max_distance
+            )
+
+            if density:
+                if self._info_enabled():
+                    self.logger.info(
+                        "counter_density_detected",
+                        symbol=position.symbol,
+                        position_id=position.id,
+                        direction=position.direction.value,
+                        density_price=density.price_level,
+                        current_price=current_price,
+                        max_distance_percent=max_distance,
+                    )
+                return True
 
             return False
 
@@ -211,14 +429,32 @@ class PositionMonitor:
             self.logger.error(
                 "counter_density_check_error",
                 symbol=position.symbol,
-                position_id=str(position.id),
+                position_id=position.id,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._exc_info(),
             )
             return False
 
+    @staticmethod
+    def _is_imbalance_reversed_long(
+        current_imbalance: float, avg_imbalance: float, threshold: float
+    ) -> bool:
+        """Sudden drop in bid/ask ratio: sellers pressing against a LONG."""
+        return current_imbalance < avg_imbalance / threshold
+
+    @staticmethod
+    def _is_imbalance_reversed_short(
+        current_imbalance: float, avg_imbalance: float, threshold: float
+    ) -> bool:
+        """Sudden rise in bid/ask ratio: buyers pressing against a SHORT."""
+        return current_imbalance > avg_imbalance * threshold
+
     def _check_aggressive_counter_orders(
-        self, position: Position, params: CoinParameters
+        self,
+        position: Position,
+        orderbook: OrderBook,
+        params: CoinParameters,
+        checks: _DirectionChecks,
     ) -> bool:
         """
         Check for aggressive counter orders via orderbook imbalance change.
@@ -228,68 +464,50 @@ class PositionMonitor:
 
         Args:
             position: Position to check
+            orderbook: Orderbook snapshot for this tick
             params: CoinParameters with thresholds
+            checks: Direction-specific checks for the position
 
         Returns:
             True if aggressive counter orders detected
         """
         try:
-            orderbook = self.orderbook_manager.get_current_orderbook(position.symbol)
-            volume_history = self.orderbook_manager.get_volume_history(position.symbol, seconds=10)
+            bid_history, ask_history = self.orderbook_manager.get_volume_history(
+                position.symbol, seconds=10
+            )
 
-            if not orderbook or len(volume_history) < 5:
+            if len(bid_history) < 5:
                 return False
 
-            current_bid = orderbook.get_total_volume(OrderSide.BID)
-            current_ask = orderbook.get_total_volume(OrderSide.ASK)
+            current_bid = orderbook.get_total_volume_float(OrderSide.BID)
+            current_ask = orderbook.get_total_volume_float(OrderSide.ASK)
 
-            if current_ask == 0:
+            if current_ask == 0.0:
                 return False
 
             # Current imbalance ratio
             current_imbalance = current_bid / current_ask
 
             # Calculate average imbalance from history
-            imbalances = []
-            for _, bid_vol, ask_vol in volume_history:
-                if ask_vol > 0:
-                    imbalances.append(bid_vol / ask_vol)
+            avg_imbalance = _kernels.mean_imbalance(bid_history, ask_history)
 
-            if not imbalances:
+            if math.isnan(avg_imbalance):
                 return False
 
-            # Convert to Decimal for financial precision
-            avg_imbalance = Decimal(sum(imbalances)) / Decimal(len(imbalances))
-
             # Get threshold from params (default 2.0 = 200%)
-            threshold = getattr(params, 'tp_imbalance_change_threshold', Decimal("2.0"))
+            threshold = params.tp_imbalance_change_threshold
 
-            if position.direction == PositionDirection.LONG:
-                # Check for sudden decrease in bid/ask ratio (more asks = selling pressure)
-                # LOW imbalance = more sellers trying to exit
-                if current_imbalance < avg_imbalance / threshold:
+            if checks.is_imbalance_reversed(current_imbalance, avg_imbalance, threshold):
+                if self._info_enabled():
                     self.logger.info(
                         "aggressive_counter_orders_detected",
                         symbol=position.symbol,
-                        position_id=str(position.id),
-                        direction="LONG",
-                        current_imbalance=float(current_imbalance),
-                        avg_imbalance=float(avg_imbalance),
-                    )
-                    return True
-            else:
-                # Check for sudden increase in bid/ask ratio (more bids = buying pressure)
-                # HIGH imbalance = more buyers trying to enter
-                if current_imbalance > avg_imbalance * threshold:
-                    self.logger.info(
-                        "aggressive_counter_orders_detected",
-                        symbol=position.symbol,
-                        position_id=str(position.id),
-                        direction="SHORT",
-                        current_imbalance=float(current_imbalance),
-                        avg_imbalance=float(avg_imbalance),
+                        position_id=position.id,
+                        direction=position.direction.value,
+                        current_imbalance=current_imbalance,
+                        avg_imbalance=avg_imbalance,
                     )
-                    return True
+                return True
 
             return False
 
@@ -297,13 +515,25 @@ class PositionMonitor:
             self.logger.error(
                 "aggressive_counter_orders_check_error",
                 symbol=position.symbol,
-                position_id=str(position.id),
+                position_id=position.id,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._exc_info(),
             )
             return False
 
-    def _check_return_to_known_levels(self, position: Position) -> bool:
+    @staticmethod
+    def _is_back_in_range_long(current_price: float, density_price: float) -> bool:
+        """LONG breakout failed: price returned below the broken density."""
+        return current_price < density_price
+
+    @staticmethod
+    def _is_back_in_range_short(current_price: float, density_price: float) -> bool:
+        """SHORT breakout failed: price returned above the broken density."""
+        return current_price > density_price
+
+    def _check_return_to_known_levels(
+        self, position: Position, orderbook: OrderBook, checks: _DirectionChecks
+    ) -> bool:
         """
         Check if price returned to known levels (density breakout failed).
 
@@ -312,6 +542,8 @@ class PositionMonitor:
 
         Args:
             position: Position to check
+            orderbook: Orderbook snapshot for this tick
+            checks: Direction-specific checks for the position
 
         Returns:
             True if returned to known levels
@@ -321,38 +553,23 @@ class PositionMonitor:
             if position.signal_type != SignalType.BREAKOUT:
                 return False
 
-            orderbook = self.orderbook_manager.get_current_orderbook(position.symbol)
-            if not orderbook:
-                return False
-
-            current_price = orderbook.get_mid_price()
+            current_price = orderbook.get_mid_price_float()
             if not current_price:
                 return False
 
-            if position.direction == PositionDirection.LONG:
-                # Returned below breakout density
-                if current_price < position.density_price:
-                    self.logger.info(
-                        "return_to_known_levels_detected",
-                        symbol=position.symbol,
-                        position_id=str(position.id),
-                        direction="LONG",
-                        current_price=float(current_price),
-                        density_price=float(position.density_price),
-                    )
-                    return True
-            else:
-                # Returned above breakout density
-                if current_price > position.density_price:
+            density_price = position.density_price_f
+
+            if checks.is_back_in_range(current_price, density_price):
+                if self._info_enabled():
                     self.logger.info(
                         "return_to_known_levels_detected",
                         symbol=position.symbol,
-                        position_id=str(position.id),
-                        direction="SHORT",
-                        current_price=float(current_price),
-                        density_price=float(position.density_price),
+                        position_id=position.id,
+                        direction=position.direction.value,
+                        current_price=current_price,
+                        density_price=density_price,
                     )
-                    return True
+                return True
 
             return False
 
@@ -360,9 +577,9 @@ class PositionMonitor:
             self.logger.error(
                 "return_to_known_levels_check_error",
                 symbol=position.symbol,
-                position_id=str(position.id),
+                position_id=position.id,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._exc_info(),
             )
             return False
 
@@ -387,23 +604,64 @@ class PositionMonitor:
                     f"already monitoring position {existing.id}"
                 )
             # Already monitoring this exact position
-            self.logger.debug("position_already_monitored", symbol=symbol, position_id=str(position.id))
+            self.logger.debug("position_already_monitored", symbol=symbol, position_id=position.id)
             return
 
-        self._monitored_positions[symbol] = position
+        # Bind per-position state before the position becomes visible
+        self._direction_checks[position.id] = (
+            self._long_checks
+            if position.direction == PositionDirection.LONG
+            else self._short_checks
+        )
+        self._breakeven_checks[position.id] = (
+            self._breakout_breakeven_reached
+            if position.signal_type == SignalType.BREAKOUT
+            else self._bounce_breakeven_reached
+        )
+
+        # Bind params once; the cache pushes updates when they change
+        cache = self.db_manager.coin_params_cache
+        params = cache.get_sync(symbol)
+        if params:
+            self._params[symbol] = params
+        cache.subscribe(symbol, self._on_params_changed)
+
+        monitored = dict(self._monitored_positions)
+        monitored[symbol] = position
+        self._monitored_positions = monitored
+        self._rebuild_snapshot()
 
         self.logger.info(
             "position_monitoring_started",
             symbol=symbol,
-            position_id=str(position.id),
+            position_id=position.id,
             direction=position.direction.value,
             signal_type=position.signal_type.value,
-            entry=float(position.entry_price),
-            stop_loss=float(position.stop_loss),
-            size=float(position.size),
+            entry=position.entry_price,
+            stop_loss=position.stop_loss,
+            size=position.size,
             leverage=position.leverage,
         )
 
+    def _rebuild_snapshot(self) -> None:
+        """Rebuild the immutable views after monitored positions change."""
+        self._snapshot = tuple(self._monitored_positions.items())
+        self._symbols_snapshot = tuple(self._monitored_positions)
+
+        positions = self._monitored_positions.values()
+        count = len(positions)
+        self._entry_prices = np.fromiter(
+            (float(p.entry_price) for p in positions), dtype=np.float64, count=count
+        )
+        self._direction_signs = np.fromiter(
+            (1.0 if p.direction == PositionDirection.LONG else -1.0 for p in positions),
+            dtype=np.float64,
+            count=count,
+        )
+        self._leverages = np.fromiter(
+            (p.leverage for p in positions), dtype=np.float64, count=count
+        )
+
     async def stop_monitoring(self, symbol: str) -> None:
         """
         Stop monitoring a position.
@@ -412,13 +670,21 @@ class PositionMonitor:
             symbol: Symbol to stop monitoring
         """
         if symbol in self._monitored_positions:
-            position = self._monitored_positions[symbol]
-            del self._monitored_positions[symbol]
+            monitored = dict(self._monitored_positions)
+            position = monitored.pop(symbol)
+            self._monitored_positions = monitored
+            self._rebuild_snapshot()
+            self._velocity_cache.pop(symbol, None)
+            self._last_checked_sequence.pop(symbol, None)
+            self._direction_checks.pop(position.id, None)
+            self._breakeven_checks.pop(position.id, None)
+            self._params.pop(symbol, None)
+            self.db_manager.coin_params_cache.unsubscribe(symbol, self._on_params_changed)
 
             self.logger.info(
                 "position_monitoring_stopped",
                 symbol=symbol,
-                position_id=str(position.id),
+                position_id=position.id,
             )
         else:
             self.logger.warning(
@@ -441,83 +707,231 @@ class PositionMonitor:
         """
         positions_to_close = []
 
-        for symbol, position in list(self._monitored_positions.items()):
+        # Fetch market data and any unbound params for all positions at once
+        symbols = self._symbols_snapshot
+        orderbooks = self.orderbook_manager.get_orderbooks_bulk(symbols)
+
+        bound_params = self._params
+        missing = [symbol for symbol in symbols if symbol not in bound_params]
+        if missing:
+            bound_params.update(self.db_manager.coin_params_cache.get_sync_many(missing))
+
+        last_checked = self._last_checked_sequence
+        sequences = {}
+        snapshot = []
+        count = len(self._snapshot)
+        current_prices = np.full(count, np.nan)
+        thresholds_bps = np.zeros(count)
+        breakeven_pending = np.zeros(count, dtype=np.bool_)
+
+        for index, (symbol, position) in enumerate(self._snapshot):
             # Skip if position is not open
             if position.status != PositionStatus.OPEN:
                 self.logger.warning(
                     "position_not_open",
                     symbol=symbol,
-                    position_id=str(position.id),
+                    position_id=position.id,
                     status=position.status.value,
                 )
                 continue
 
-            try:
-                # Get current market price
-                orderbook = self.orderbook_manager.get_current_orderbook(symbol)
-                if not orderbook:
-                    self.logger.debug(
-                        "orderbook_not_available",
-                        symbol=symbol,
-                    )
-                    continue
+            # Nothing new to evaluate once breakeven is done and the book
+            # (and its densities) has not been updated since the last check
+            sequence = self.orderbook_manager.get_sequence(symbol)
+            if position.breakeven_moved and last_checked.get(symbol) == sequence:
+                continue
 
-                current_price = orderbook.get_mid_price()
-                if not current_price:
-                    self.logger.warning(
-                        "mid_price_not_available",
-                        symbol=symbol,
-                    )
-                    continue
+            # Get current market price
+            orderbook = orderbooks.get(symbol)
+            if not orderbook:
+                self.logger.debug(
+                    "orderbook_not_available",
+                    symbol=symbol,
+                )
+                continue
 
-                # Get coin parameters
-                params = self.db_manager.coin_params_cache.get_sync(symbol)
-                if not params:
-                    self.logger.warning(
-                        "coin_parameters_not_available",
-                        symbol=symbol,
-                    )
-                    continue
+            current_price = orderbook.get_mid_price()
+            if not current_price:
+                self.logger.warning(
+                    "mid_price_not_available",
+                    symbol=symbol,
+                )
+                continue
 
-                # Check for breakeven stop-loss move
-                if not position.breakeven_moved:
-                    should_move = await self._check_breakeven_conditions(
-                        position, current_price, params
-                    )
-                    if should_move:
-                        await self._move_to_breakeven(position)
+            # Get coin parameters (bound at start_monitoring)
+            params = bound_params.get(symbol)
+            if not params:
+                self.logger.warning(
+                    "coin_parameters_not_available",
+                    symbol=symbol,
+                )
+                continue
 
-                # Check for exit conditions
-                exit_reason = await self._check_exit_conditions(
-                    position, current_price, params
+            current_prices[index] = orderbook.get_mid_price_float()
+            thresholds_bps[index] = params.breakout_breakeven_bps
+            breakeven_pending[index] = (
+                position.signal_type == SignalType.BREAKOUT and not position.breakeven_moved
+            )
+            sequences[symbol] = sequence
+            snapshot.append((index, symbol, position, orderbook, current_price, params))
+
+        # Breakout breakeven decisions for all positions in one vectorized pass
+        breakeven_ready = _kernels.breakeven_mask(
+            current_prices,
+            self._entry_prices,
+            self._direction_signs,
+            self._leverages,
+            thresholds_bps,
+            breakeven_pending,
+        ).tolist()
+
+        # Process positions concurrently; evaluation runs inline on the event
+        # loop, only stop-loss updates await I/O
+        results = await asyncio.gather(
+            *(
+                self._process_one(
+                    symbol, position, orderbook, current_price, params, breakeven_ready[index]
                 )
+                for index, symbol, position, orderbook, current_price, params in snapshot
+            ),
+            return_exceptions=True,
+        )
 
-                if exit_reason:
-                    position.exit_reason = exit_reason
-                    position.status = PositionStatus.CLOSING
-                    positions_to_close.append(position)
+        for (_, symbol, position, _, _, _), result in zip(snapshot, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "position_check_error",
+                    symbol=symbol,
+                    position_id=position.id,
+                    error=str(result),
+                    exc_info=result if self._exc_info() else False,
+                )
+                continue
 
-                    self.logger.info(
-                        "position_marked_for_closure",
-                        symbol=symbol,
-                        position_id=str(position.id),
-                        exit_reason=exit_reason.value,
-                        current_price=float(current_price),
-                    )
+            last_checked[symbol] = sequences[symbol]
+            if result is not None:
+                positions_to_close.append(result)
 
+        # Persist CLOSING status for the whole batch in one round-trip
+        if positions_to_close:
+            try:
+                await self.db_manager.mark_trades_closing(
+                    {position.id: position.exit_reason for position in positions_to_close}
+                )
             except Exception as e:
                 self.logger.error(
-                    "position_check_error",
-                    symbol=symbol,
-                    position_id=str(position.id),
+                    "mark_trades_closing_error",
+                    count=len(positions_to_close),
                     error=str(e),
                     exc_info=True,
                 )
 
         return positions_to_close
 
-    async def _check_breakeven_conditions(
-        self, position: Position, current_price: Decimal, params
+    async def _process_one(
+        self,
+        symbol: str,
+        position: Position,
+        orderbook: OrderBook,
+        current_price: Decimal,
+        params: CoinParameters,
+        breakeven_ready: bool,
+    ) -> Optional[Position]:
+        """
+        Check one position and apply breakeven / exit decisions.
+
+        Args:
+            symbol: Trading symbol
+            position: Position to check
+            orderbook: Orderbook snapshot for this tick
+            current_price: Current market price
+            params: Coin parameters with thresholds
+            breakeven_ready: Breakout profit reached the breakeven threshold
+
+        Returns:
+            The position if it should be closed, None otherwise
+        """
+        # Evaluate inline: the checks read orderbook manager state (history
+        # buffers, densities) that is only consistent on the event loop, and
+        # the per-position work is too small to pay for a thread hop
+        should_move, exit_reason = self._evaluate_position_sync(
+            position,
+            orderbook,
+            current_price,
+            params,
+            breakeven_ready,
+        )
+
+        # Move stop-loss to breakeven if conditions were met
+        if should_move:
+            await self._move_to_breakeven(position)
+
+        if not exit_reason:
+            return None
+
+        position.exit_reason = exit_reason
+        position.status = PositionStatus.CLOSING
+
+        if self._info_enabled():
+            self.logger.info(
+                "position_marked_for_closure",
+                symbol=symbol,
+                position_id=position.id,
+                exit_reason=exit_reason.value,
+                current_price=current_price,
+            )
+        return position
+
+    def _evaluate_position_sync(
+        self,
+        position: Position,
+        orderbook: OrderBook,
+        current_price: Decimal,
+        params: CoinParameters,
+        breakeven_ready: bool,
+    ) -> tuple[bool, Optional[ExitReason]]:
+        """
+        Run breakeven and exit checks for one position.
+
+        Pure computation over market data; must run on the event loop, which
+        owns the orderbook manager state it reads. The position itself is
+        updated by the caller.
+
+        Args:
+            position: Position to check
+            orderbook: Orderbook snapshot for this tick
+            current_price: Current market price
+            params: Coin parameters with thresholds
+            breakeven_ready: Breakout profit reached the breakeven threshold
+
+        Returns:
+            (should_move_to_breakeven, exit_reason or None)
+        """
+        # Look up the bounce density once for both checks
+        target_density = None
+        if position.signal_type == SignalType.BOUNCE:
+            target_density = self.orderbook_manager.get_density(
+                position.symbol, position.density_side, position.density_price
+            )
+
+        should_move = (
+            not position.breakeven_moved
+            and self._check_breakeven_conditions(
+                position, current_price, params, target_density, breakeven_ready
+            )
+        )
+        exit_reason = self._check_exit_conditions(
+            position, orderbook, current_price, params, target_density
+        )
+        return should_move, exit_reason
+
+    def _check_breakeven_conditions(
+        self,
+        position: Position,
+        current_price: Decimal,
+        params,
+        target_density: Optional[Density] = None,
+        breakeven_ready: bool = False,
     ) -> bool:
         """
         Check if position should move stop-loss to breakeven.
@@ -532,94 +946,89 @@ class PositionMonitor:
             position: Position to check
             current_price: Current market price
             params: Coin parameters with thresholds
+            target_density: Current bounce density (None if not found)
+            breakeven_ready: Breakout profit reached the breakeven threshold
 
         Returns:
             True if should move to breakeven
         """
         try:
-            if position.signal_type == SignalType.BREAKOUT:
-                # Breakout: Move when profit >= breakeven_profit_percent
-                profit_percent = position.calculate_profit_percent(current_price)
-                threshold = params.breakout_breakeven_profit_percent
-
-                if profit_percent >= threshold:
-                    self.logger.info(
-                        "breakeven_condition_met_breakout",
-                        symbol=position.symbol,
-                        position_id=str(position.id),
-                        profit_percent=float(profit_percent),
-                        threshold=float(threshold),
-                        current_price=float(current_price),
-                        entry_price=float(position.entry_price),
-                    )
-                    return True
-
-            elif position.signal_type == SignalType.BOUNCE:
-                # Bounce: Move when density erodes >= erosion_exit_percent
-                densities = self.orderbook_manager.get_current_densities(position.symbol)
-
-                # Find the density that triggered this position
-                target_density = None
-                for d in densities:
-                    if (d.price_level == position.density_price and
-                        self._is_same_side(d.side.value, position.direction)):
-                        target_density = d
-                        break
-
-                if target_density:
-                    erosion = target_density.erosion_percent()
-                    threshold = params.bounce_density_erosion_exit_percent
-
-                    if erosion >= threshold:
-                        self.logger.info(
-                            "breakeven_condition_met_bounce",
-                            symbol=position.symbol,
-                            position_id=str(position.id),
-                            density_price=float(target_density.price_level),
-                            density_erosion=float(erosion),
-                            threshold=float(threshold),
-                            initial_volume=float(target_density.initial_volume),
-                            current_volume=float(target_density.volume),
-                        )
-                        return True
-                else:
-                    self.logger.debug(
-                        "target_density_not_found",
-                        symbol=position.symbol,
-                        position_id=str(position.id),
-                        density_price=float(position.density_price),
-                        direction=position.direction.value,
-                    )
+            return self._breakeven_checks[position.id](
+                position, current_price, params, target_density, breakeven_ready
+            )
 
         except Exception as e:
             self.logger.error(
                 "breakeven_check_error",
                 symbol=position.symbol,
-                position_id=str(position.id),
+                position_id=position.id,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._exc_info(),
             )
 
         return False
 
-    def _is_same_side(self, density_side: str, position_direction: PositionDirection) -> bool:
-        """
-        Check if density side matches position direction.
+    def _breakout_breakeven_reached(
+        self,
+        position: Position,
+        current_price: Decimal,
+        params: CoinParameters,
+        target_density: Optional[Density],
+        breakeven_ready: bool,
+    ) -> bool:
+        """Breakout: move when profit >= breakeven_profit_percent."""
+        if breakeven_ready:
+            if self._info_enabled():
+                self.logger.info(
+                    "breakeven_condition_met_breakout",
+                    symbol=position.symbol,
+                    position_id=position.id,
+                    profit_percent=position.calculate_profit_percent(current_price),
+                    threshold=params.breakout_breakeven_profit_percent,
+                    current_price=current_price,
+                    entry_price=position.entry_price,
+                )
+            return True
 
-        LONG positions use BID density (support below price)
-        SHORT positions use ASK density (resistance above price)
+        return False
 
-        Args:
-            density_side: Side of density ("BID" or "ASK")
-            position_direction: Direction of position (LONG or SHORT)
+    def _bounce_breakeven_reached(
+        self,
+        position: Position,
+        current_price: Decimal,
+        params: CoinParameters,
+        target_density: Optional[Density],
+        breakeven_ready: bool,
+    ) -> bool:
+        """Bounce: move when density erodes >= erosion_exit_percent."""
+        if not target_density:
+            self.logger.debug(
+                "target_density_not_found",
+                symbol=position.symbol,
+                position_id=position.id,
+                density_price=position.density_price,
+                direction=position.direction.value,
+            )
+            return False
 
-        Returns:
-            True if density side matches position direction
-        """
-        if position_direction == PositionDirection.LONG:
-            return density_side == "BID"  # LONG positions use BID density (support)
-        else:
-            return density_side == "ASK"  # SHORT positions use ASK density (resistance)
+        erosion = target_density.erosion_cached
+        threshold = float(params.bounce_density_erosion_exit_percent)
+
+        if erosion >= threshold:
+            if self._info_enabled():
+                self.logger.info(
+                    "breakeven_condition_met_bounce",
+                    symbol=position.symbol,
+                    position_id=position.id,
+                    density_price=target_density.price_level,
+                    density_erosion=erosion,
+                    threshold=threshold,
+                    initial_volume=target_density.initial_volume,
+                    current_volume=target_density.volume,
+                )
+            return True
+
+        return False
 
     async def _move_to_breakeven(self, position: Position) -> None:
         """
@@ -635,106 +1044,152 @@ class PositionMonitor:
         position.stop_loss = position.entry_price
         position.breakeven_moved = True
 
-        # TODO: Update stop-loss on exchange via API
-        # For now, just update in memory and log
-        # In production, this would call:
-        # await self.exchange_api.modify_stop_loss(position.id, position.entry_price)
+        # Submit to the exchange without waiting for the REST round-trip
+        if self.order_executor:
+            try:
+                self._sl_submit_queue.put_nowait((position, old_stop, position.entry_price))
+            except asyncio.QueueFull:
+                self._rollback_breakeven(position, old_stop)
+                self.logger.error(
+                    "stop_loss_queue_full",
+                    symbol=position.symbol,
+                    position_id=position.id,
+                )
+                return
 
-        self.logger.info(
-            "stop_loss_moved_to_breakeven",
-            symbol=position.symbol,
-            position_id=str(position.id),
-            old_stop_loss=float(old_stop),
-            new_stop_loss=float(position.entry_price),
-            entry_price=float(position.entry_price),
-        )
+        if self._info_enabled():
+            self.logger.info(
+                "stop_loss_moved_to_breakeven",
+                symbol=position.symbol,
+                position_id=position.id,
+                old_stop_loss=old_stop,
+                new_stop_loss=position.entry_price,
+                entry_price=position.entry_price,
+            )
 
-    async def _check_exit_conditions(
-        self, position: Position, current_price: Decimal, params
+    def _check_exit_conditions(
+        self,
+        position: Position,
+        orderbook: OrderBook,
+        current_price: Decimal,
+        params,
+        target_density: Optional[Density] = None,
     ) -> Optional[ExitReason]:
         """
         Check if position should be closed.
 
-        Exit conditions:
-        1. Velocity slowdown (3s vs 15s)
-        2. Counter density detected
-        3. Aggressive counter orders (orderbook imbalance)
-        4. Return to known levels (for breakout)
-        5. Bounce density eroded (existing)
+        Exit conditions, cheapest first (first match wins):
+        1. Return to known levels (for breakout)
+        2. Bounce density eroded or disappeared (for bounce)
+        3. Counter density detected
+        4. Velocity slowdown (3s vs 15s)
+        5. Aggressive counter orders (orderbook imbalance)
 
         Args:
             position: Position to check
+            orderbook: Orderbook snapshot for this tick
             current_price: Current market price
             params: Coin parameters
+            target_density: Current bounce density (None if not found)
 
         Returns:
             ExitReason if should close, None otherwise
         """
         try:
-            # NEW: Condition 1 - Velocity slowdown
-            if self._check_velocity_slowdown(position.symbol, params):
-                return ExitReason.MOMENTUM_SLOWDOWN
+            checks = self._direction_checks[position.id]
 
-            # NEW: Condition 2 - Counter density
-            if self._check_counter_density(position):
-                return ExitReason.COUNTER_DENSITY
+            # Condition 1 - Return to known levels (single price compare)
+            if self._check_return_to_known_levels(position, orderbook, checks):
+                return ExitReason.RETURN_TO_RANGE
 
-            # NEW: Condition 3 - Aggressive counter orders
-            if self._check_aggressive_counter_orders(position, params):
-                return ExitReason.AGGRESSIVE_REVERSAL
+            # Condition 2 - Bounce density erosion (density looked up by caller)
+            if self._check_bounce_density_erosion(position, params, target_density):
+                return ExitReason.DENSITY_EROSION
 
-            # NEW: Condition 4 - Return to known levels
-            if self._check_return_to_known_levels(position):
-                return ExitReason.RETURN_TO_RANGE
+            # Condition 3 - Counter density
+            if self._check_counter_density(position, orderbook, params, checks):
+                return ExitReason.COUNTER_DENSITY
 
-            # EXISTING: Check for bounce density erosion exit
-            if position.signal_type == SignalType.BOUNCE:
-                densities = self.orderbook_manager.get_current_densities(position.symbol)
-
-                target_density = None
-                for d in densities:
-                    if (d.price_level == position.density_price and
-                        self._is_same_side(d.side.value, position.direction)):
-                        target_density = d
-                        break
-
-                if target_density:
-                    erosion = target_density.erosion_percent()
-                    threshold = params.bounce_density_erosion_exit_percent
-
-                    if erosion >= threshold:
-                        self.logger.info(
-                            "bounce_density_eroded",
-                            symbol=position.symbol,
-                            position_id=str(position.id),
-                            density_price=float(target_density.price_level),
-                            erosion=float(erosion),
-                            threshold=float(threshold),
-                            initial_volume=float(target_density.initial_volume),
-                            current_volume=float(target_density.volume),
-                        )
-                        return ExitReason.DENSITY_EROSION
-                else:
-                    # If density completely disappeared, also exit
-                    self.logger.warning(
-                        "bounce_density_disappeared",
-                        symbol=position.symbol,
-                        position_id=str(position.id),
-                        density_price=float(position.density_price),
-                    )
-                    return ExitReason.DENSITY_EROSION
+            # Condition 4 - Velocity slowdown (price history)
+            if self._check_velocity_slowdown(position.symbol, params):
+                return ExitReason.MOMENTUM_SLOWDOWN
+
+            # Condition 5 - Aggressive counter orders (volume history)
+            if self._check_aggressive_counter_orders(position, orderbook, params, checks):
+                return ExitReason.AGGRESSIVE_REVERSAL
 
         except Exception as e:
             self.logger.error(
                 "exit_condition_check_error",
                 symbol=position.symbol,
-                position_id=str(position.id),
+                position_id=position.id,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._exc_info(),
             )
 
         return None
 
+    def _check_bounce_density_erosion(
+        self,
+        position: Position,
+        params: CoinParameters,
+        target_density: Optional[Density],
+    ) -> bool:
+        """
+        Check if the density a bounce position was opened on has eroded.
+
+        A density that disappeared entirely also counts as eroded.
+
+        Args:
+            position: Position to check
+            params: CoinParameters with thresholds
+            target_density: Current bounce density (None if not found)
+
+        Returns:
+            True if the bounce density eroded past the exit threshold
+        """
+        if position.signal_type != SignalType.BOUNCE:
+            return False
+
+        if not target_density:
+            # If density completely disappeared, also exit
+            self.logger.warning(
+                "bounce_density_disappeared",
+                symbol=position.symbol,
+                position_id=position.id,
+                density_price=position.density_price,
+            )
+            return True
+
+        erosion = target_density.erosion_cached
+        threshold = float(params.bounce_density_erosion_exit_percent)
+
+        if erosion >= threshold:
+            self.logger.info(
+                "bounce_density_eroded",
+                symbol=position.symbol,
+                position_id=position.id,
+                density_price=target_density.price_level,
+                erosion=erosion,
+                threshold=threshold,
+                initial_volume=target_density.initial_volume,
+                current_volume=target_density.volume,
+            )
+            return True
+
+        return False
+
+    def _on_params_changed(self, params: CoinParameters) -> None:
+        """
+        Rebind coin parameters after the cache entry for a symbol changes.
+
+        Args:
+            params: Updated coin parameters
+        """
+        if params.symbol in self._monitored_positions:
+            self._params[params.symbol] = params
+            self._last_checked_sequence.pop(params.symbol, None)
+
     def get_monitored_positions(self) -> List[Position]:
         """
         Get list of all currently monitored positions.
@@ -742,7 +1197,7 @@ class PositionMonitor:
         Returns:
             List of monitored positions
         """
-        return list(self._monitored_positions.values())
+        return [position for _, position in self._snapshot]
 
     def get_position(self, symbol: str) -> Optional[Position]:
         """
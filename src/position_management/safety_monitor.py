@@ -6,16 +6,64 @@ and enforces safety limits to protect against catastrophic losses.
 """
 
 import asyncio
+import logging
+import random
+import time
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 from datetime import datetime, timedelta
 
+import asyncpg
+
 from src.storage.db_manager import DatabaseManager
 from src.trading_execution.order_executor import OrderExecutor
 from src.storage.models import SystemEvent
 from src.utils.logger import get_logger
 from src.utils.types import EVENT_SEVERITY_CRITICAL
 
+_ZERO = Decimal(0)
+_HUNDRED = Decimal(100)
+_DEFAULT_MAX_LOSS_PERCENT = Decimal(10)
+
+# Circuit breaker states for the connection health check
+_CIRCUIT_CLOSED = "closed"
+_CIRCUIT_OPEN = "open"
+_CIRCUIT_HALF_OPEN = "half_open"
+
+# Default max simultaneous close requests during emergency shutdown
+_EMERGENCY_CLOSE_CONCURRENCY = 10
+
+# Upper bound for a single retry backoff during emergency procedures (seconds)
+_MAX_RETRY_BACKOFF = 8.0
+
+# Critical events waiting for the background database writer
+_EVENT_QUEUE_SIZE = 1024
+
+# Errors a database round-trip can raise (RuntimeError: pool not connected)
+_DB_ERRORS = (
+    asyncpg.PostgresError,
+    asyncpg.InterfaceError,
+    OSError,
+    asyncio.TimeoutError,
+    RuntimeError,
+)
+
+
+def _retry_backoff(attempt: int) -> float:
+    """
+    Calculate a full-jitter exponential backoff delay.
+
+    Random delays keep parallel retries (e.g. emergency closes) from hitting
+    the exchange at the same moment.
+
+    Args:
+        attempt: Zero-based retry attempt
+
+    Returns:
+        Delay in seconds between 0 and min(0.5 * 2**attempt, _MAX_RETRY_BACKOFF)
+    """
+    return random.uniform(0, min(0.5 * (2 ** attempt), _MAX_RETRY_BACKOFF))
+
 
 class SafetyMonitor:
     """
@@ -33,15 +81,25 @@ class SafetyMonitor:
     - Position exposure limits (total and per-position)
     - Connection health monitoring
     - Critical event logging
-    - Trading disable on repeated failures
+    - Trading disable on repeated connection failures (circuit breaker with
+      half-open probing; the capital loss check always runs)
     """
 
     def __init__(
         self,
         db_manager: DatabaseManager,
         order_executor: OrderExecutor,
-        initial_balance: Decimal = Decimal("0"),
-        max_loss_percent: Decimal = Decimal("10"),
+        initial_balance: Decimal = _ZERO,
+        max_loss_percent: Decimal = _DEFAULT_MAX_LOSS_PERCENT,
+        parallel_checks: bool = True,
+        balance_ttl_seconds: float = 1.0,
+        failure_threshold: int = 3,
+        circuit_cooldown_seconds: float = 30.0,
+        max_circuit_cooldown_seconds: float = 300.0,
+        deep_health_interval_seconds: float = 10.0,
+        db_health_timeout_seconds: float = 2.0,
+        check_interval_seconds: float = 30.0,
+        emergency_close_concurrency: int = _EMERGENCY_CLOSE_CONCURRENCY,
     ):
         """
         Initialize safety monitor.
@@ -51,30 +109,99 @@ class SafetyMonitor:
             order_executor: Order executor instance
             initial_balance: Starting balance for loss calculation (fetched on startup if 0)
             max_loss_percent: Maximum allowed loss as % of initial balance (default: 10%)
+            parallel_checks: Fetch balance and check connection health concurrently
+                (False = run them one after another)
+            balance_ttl_seconds: How long a fetched balance is reused (default: 1s)
+            failure_threshold: Consecutive failed health checks that open the circuit (default: 3)
+            circuit_cooldown_seconds: Initial wait before probing an open circuit (default: 30s)
+            max_circuit_cooldown_seconds: Cap for the cooldown, which doubles after
+                every failed probe, plus up to 25% jitter (default: 300s)
+            deep_health_interval_seconds: Minimum time between SELECT 1 probes;
+                checks in between only verify the pool is open (default: 10s)
+            db_health_timeout_seconds: Timeout for the SELECT 1 probe (default: 2s)
+            check_interval_seconds: Time between safety checks; kept fixed so the
+                capital loss check is never slowed by database failures (default: 30s)
+            emergency_close_concurrency: Max close requests in flight during
+                emergency shutdown, to stay within exchange rate limits (default: 10)
         """
         self.db_manager = db_manager
         self.order_executor = order_executor
-        self.initial_balance = initial_balance
         self.max_loss_percent = max_loss_percent
+        self.parallel_checks = parallel_checks
+        self.emergency_close_concurrency = emergency_close_concurrency
         self.logger = get_logger(__name__)
+        self._stdlib_logger = logging.getLogger(__name__)
+
+        # Sets the loss trigger and the static part of get_status()
+        self._set_initial_balance(initial_balance)
+
+        # Last fetched balance as (value, time.monotonic() when fetched)
+        self._balance_cache: Optional[Tuple[Decimal, float]] = None
+        self._balance_ttl = balance_ttl_seconds
+        self._balance_lock = asyncio.Lock()
+
+        # Circuit breaker for the connection health check: after
+        # failure_threshold failed checks the circuit opens and the check
+        # fails fast (no database I/O) until a single probe succeeds
+        self._failure_threshold = failure_threshold
+        self._base_cooldown = circuit_cooldown_seconds
+        self._max_cooldown = max_circuit_cooldown_seconds
+        self._circuit_state = _CIRCUIT_CLOSED
+        self._circuit_cooldown = circuit_cooldown_seconds
+        self._circuit_retry_at = 0.0
+        self._consecutive_failures = 0
+        self._probe_lock = asyncio.Lock()
+
+        # Last successful SELECT 1 (time.monotonic())
+        self._deep_health_interval = deep_health_interval_seconds
+        self._last_deep_health_check = 0.0
+        self._db_health_timeout = db_health_timeout_seconds
+
+        self.check_interval_seconds = check_interval_seconds
+
+        # Critical events written to the database by a background task
+        self._event_queue: asyncio.Queue[SystemEvent] = asyncio.Queue(
+            maxsize=_EVENT_QUEUE_SIZE
+        )
+        self._event_task: Optional[asyncio.Task] = None
+
+        # Validated once; events are copies with their own type/message/time
+        self._critical_event_template = SystemEvent(
+            event_type="",
+            severity=EVENT_SEVERITY_CRITICAL,
+            message="",
+        )
 
         self._emergency_shutdown = False
         self._trading_enabled = True
-        self._last_balance_check: Optional[datetime] = None
+
+        # is_trading_enabled() result, recomputed whenever an input flag changes
+        self._effective_enabled = True
+
+        # Last balance check as time.monotonic(); converted to wall-clock
+        # through the anchor only when the status is requested
+        self._clock_anchor = (time.monotonic(), datetime.now())
+        self._last_balance_check_mono = 0.0
+        self._last_balance_check_iso: Optional[str] = None
+        self._last_balance_check_iso_mono = 0.0
 
         self.logger.info(
             "safety_monitor_initialized",
-            initial_balance=float(initial_balance),
-            max_loss_percent=float(max_loss_percent),
+            initial_balance=initial_balance,
+            max_loss_percent=max_loss_percent,
         )
 
     async def check_safety_conditions(self, balance: Optional[Decimal] = None) -> bool:
         """
         Check all safety conditions.
 
-        Safety checks (in order):
-        1. Capital loss check - triggers emergency if loss > max_loss_percent
-        2. Connection health - technical check only
+        Safety checks:
+        1. Capital loss check - runs on every call; triggers emergency if
+           loss > max_loss_percent
+        2. Connection health - technical check behind a circuit breaker
+
+        The balance fetch (exchange) and the connection health check
+        (database) are independent, so they run concurrently by default.
 
         Args:
             balance: Optional current account balance
@@ -83,33 +210,180 @@ class SafetyMonitor:
             True if all conditions pass, False otherwise
         """
         try:
-            # Fetch balance if not provided
-            if balance is None:
-                balance = await self.order_executor.get_account_balance()
+            # One clock read for the whole cycle
+            now = time.monotonic()
+
+            # Fetch balance (if not provided) alongside the connection health check
+            if balance is None and self.parallel_checks:
+                balance, health_ok = await asyncio.gather(
+                    self._get_balance_cached(),
+                    self._check_connection_health_guarded(now),
+                )
+            else:
+                if balance is None:
+                    balance = await self._get_balance_cached()
+                health_ok = await self._check_connection_health_guarded(now)
 
             # Initialize initial_balance on first check
-            if self.initial_balance == Decimal("0"):
-                self.initial_balance = balance
+            if self.initial_balance == _ZERO:
+                self._set_initial_balance(balance)
                 self.logger.info(
                     "initial_balance_set",
-                    initial_balance=float(self.initial_balance),
+                    initial_balance=self.initial_balance,
                 )
 
             # Check 1: Capital loss (ONLY trigger for emergency shutdown)
-            capital_ok = await self._check_capital_loss(balance)
+            capital_ok = await self._check_capital_loss(balance, now)
             if not capital_ok:
                 return False
 
             # Check 2: Connection health (technical check)
-            health_ok = await self._check_connection_health()
-
             return health_ok
 
         except Exception as e:
             self.logger.error("safety_check_error", error=str(e), exc_info=True)
             return False
 
-    async def _check_capital_loss(self, balance: Decimal) -> bool:
+    async def _check_connection_health_guarded(self, now: float) -> bool:
+        """
+        Run the connection health check behind a circuit breaker.
+
+        While the circuit is open this fails fast without any database calls.
+        After the cooldown one probe runs (half-open): success closes the
+        circuit, failure reopens it with a doubled cooldown.
+
+        Args:
+            now: time.monotonic() at the start of the safety cycle
+
+        Returns:
+            True if connections are healthy, False otherwise
+        """
+        if self._circuit_state == _CIRCUIT_CLOSED:
+            ok = await self._check_connection_health(now)
+        else:
+            if self._circuit_state == _CIRCUIT_OPEN:
+                if now < self._circuit_retry_at:
+                    return False
+                self._circuit_state = _CIRCUIT_HALF_OPEN
+                self._refresh_trading_enabled()
+                self.logger.info("safety_circuit_half_open")
+
+            # Only one probe at a time while half-open
+            if self._probe_lock.locked():
+                return False
+            async with self._probe_lock:
+                ok = await self._check_connection_health(now)
+
+        self._record_health_result(ok)
+        return ok
+
+    def _record_health_result(self, ok: bool) -> None:
+        """
+        Update the circuit breaker with the outcome of a connection health check.
+
+        Args:
+            ok: Whether the connections are healthy
+        """
+        if ok:
+            if self._circuit_state != _CIRCUIT_CLOSED:
+                self.logger.info("safety_circuit_closed")
+            self._circuit_state = _CIRCUIT_CLOSED
+            self._refresh_trading_enabled()
+            self._circuit_cooldown = self._base_cooldown
+            self._consecutive_failures = 0
+            return
+
+        self._consecutive_failures += 1
+
+        if self._circuit_state == _CIRCUIT_HALF_OPEN:
+            # Failed probe: back off before the next one
+            self._circuit_cooldown = min(self._circuit_cooldown * 2, self._max_cooldown)
+        elif self._consecutive_failures < self._failure_threshold:
+            return
+
+        self._circuit_state = _CIRCUIT_OPEN
+        self._refresh_trading_enabled()
+        # Jitter keeps probes from lining up with other retrying clients
+        cooldown = self._circuit_cooldown
+        self._circuit_retry_at = time.monotonic() + cooldown + random.uniform(0, 0.25 * cooldown)
+        self.logger.warning(
+            "safety_circuit_opened",
+            consecutive_failures=self._consecutive_failures,
+            cooldown_seconds=self._circuit_cooldown,
+        )
+
+    async def _get_balance_cached(self) -> Decimal:
+        """
+        Get the account balance, reusing a recent fetch.
+
+        Concurrent callers share a single exchange request.
+
+        Returns:
+            Current account balance
+        """
+        async with self._balance_lock:
+            cached = self._balance_cache
+            if cached and time.monotonic() - cached[1] < self._balance_ttl:
+                return cached[0]
+
+            balance = await self.order_executor.get_account_balance()
+            self._balance_cache = (balance, time.monotonic())
+            return balance
+
+    def _set_initial_balance(self, balance: Decimal) -> None:
+        """
+        Set the initial balance and the values derived from it.
+
+        Args:
+            balance: Starting balance for loss calculation
+        """
+        self.initial_balance = balance
+
+        # Balance at or below which the capital loss limit is hit
+        self._loss_trigger_balance = self._calculate_loss_trigger()
+
+        # Fields of get_status() that only change with the initial balance
+        self._static_status = {
+            "initial_balance": float(balance),
+            "max_loss_percent": float(self.max_loss_percent),
+        }
+
+    def _get_last_balance_check_iso(self) -> Optional[str]:
+        """
+        Format the time of the last balance check, reusing the last result.
+
+        Returns:
+            ISO timestamp of the last balance check, or None if never checked
+        """
+        checked_mono = self._last_balance_check_mono
+        if checked_mono and checked_mono != self._last_balance_check_iso_mono:
+            anchor_mono, anchor_wall = self._clock_anchor
+            checked_at = anchor_wall + timedelta(seconds=checked_mono - anchor_mono)
+            self._last_balance_check_iso = checked_at.isoformat()
+            self._last_balance_check_iso_mono = checked_mono
+        return self._last_balance_check_iso
+
+    def _debug_enabled(self) -> bool:
+        """
+        Check whether DEBUG events would be emitted.
+
+        Lets per-cycle debug logs skip building their fields when filtered out.
+
+        Returns:
+            True if the DEBUG level is enabled
+        """
+        return self._stdlib_logger.isEnabledFor(logging.DEBUG)
+
+    def _calculate_loss_trigger(self) -> Decimal:
+        """
+        Calculate the balance at which the capital loss limit is reached.
+
+        Returns:
+            initial_balance reduced by max_loss_percent
+        """
+        return self.initial_balance * (_HUNDRED - self.max_loss_percent) / _HUNDRED
+
+    async def _check_capital_loss(self, balance: Decimal, now: float) -> bool:
         """
         Check if capital loss exceeds maximum allowed percentage.
 
@@ -117,45 +391,48 @@ class SafetyMonitor:
 
         Args:
             balance: Current account balance
+            now: time.monotonic() at the start of the safety cycle
 
         Returns:
             True if within acceptable loss, False if emergency triggered
         """
         try:
-            self._last_balance_check = datetime.now()
+            self._last_balance_check_mono = now
 
-            if self.initial_balance <= Decimal("0"):
+            if self.initial_balance <= _ZERO:
                 self.logger.warning("initial_balance_not_set")
                 return True
 
-            # Calculate loss percentage
-            if balance >= self.initial_balance:
-                loss_percent = Decimal("0")
-            else:
-                loss_percent = ((self.initial_balance - balance) / self.initial_balance) * Decimal("100")
-
-            self.logger.debug(
-                "capital_loss_check",
-                current_balance=float(balance),
-                initial_balance=float(self.initial_balance),
-                loss_percent=float(loss_percent),
-                max_loss_percent=float(self.max_loss_percent),
-            )
+            if self._debug_enabled():
+                self.logger.debug(
+                    "capital_loss_check",
+                    current_balance=balance,
+                    initial_balance=self.initial_balance,
+                    loss_trigger_balance=self._loss_trigger_balance,
+                    max_loss_percent=self.max_loss_percent,
+                )
 
-            if loss_percent >= self.max_loss_percent:
+            # Equivalent to loss_percent >= max_loss_percent
+            if balance <= self._loss_trigger_balance:
+                loss_percent = (
+                    (self.initial_balance - balance) / self.initial_balance * _HUNDRED
+                    if balance < self.initial_balance
+                    else _ZERO
+                )
                 self.logger.critical(
                     "capital_loss_exceeded",
-                    current_balance=float(balance),
-                    initial_balance=float(self.initial_balance),
-                    loss_percent=float(loss_percent),
-                    max_loss_percent=float(self.max_loss_percent),
+                    current_balance=balance,
+                    initial_balance=self.initial_balance,
+                    loss_percent=loss_percent,
+                    max_loss_percent=self.max_loss_percent,
                 )
 
                 # Log critical event
                 await self._log_critical_event(
                     "CAPITAL_LOSS_EXCEEDED",
                     f"Loss {loss_percent:.2f}% exceeds maximum {self.max_loss_percent}%. "
-                    f"Initial: {self.initial_balance} USDT, Current: {balance} USDT"
+                    f"Initial: {self.initial_balance} USDT, Current: {balance} USDT",
+                    durable=True,
                 )
 
                 # Trigger emergency shutdown
@@ -164,24 +441,31 @@ class SafetyMonitor:
 
             return True
 
-        except Exception as e:
+        except ArithmeticError as e:
+            # Bad balance values only; emergency shutdown errors propagate
             self.logger.error("capital_loss_check_error", error=str(e), exc_info=True)
             return True  # Don't trigger emergency on check error
 
-    async def _check_connection_health(self) -> bool:
+    async def _check_connection_health(self, now: float) -> bool:
         """
         Check database and WebSocket connections.
 
         Verifies:
-        - Database connection pool is active
-        - Simple query can be executed
+        - Database connection pool is active and not closing
+        - Simple query can be executed (at most every deep_health_interval_seconds)
+
+        Args:
+            now: time.monotonic() at the start of the safety cycle
 
         Returns:
             True if connections are healthy, False otherwise
         """
         try:
             # Check database connection
-            if not self.db_manager.pool:
+            pool = self.db_manager.pool
+            if not pool or pool.is_closing():
+                # Verify a replacement pool with a real query right away
+                self._last_deep_health_check = 0.0
                 self.logger.error("database_connection_lost")
                 await self._log_critical_event(
                     "DATABASE_CONNECTION_LOST",
@@ -189,17 +473,39 @@ class SafetyMonitor:
                 )
                 return False
 
-            # Try a simple query to verify connection
-            result = await self.db_manager.fetchval("SELECT 1")
+            # Pool is open; only round-trip a query once per interval
+            if now - self._last_deep_health_check < self._deep_health_interval:
+                return True
+
+            # Try a simple query to verify connection. Single attempt: retries
+            # would sleep inside the timeout and hide the real error as a timeout;
+            # wait_for also bounds waiting for a free pool connection
+            result = await asyncio.wait_for(
+                self.db_manager.fetchval("SELECT 1", retry_count=1),
+                timeout=self._db_health_timeout,
+            )
 
             if result != 1:
                 self.logger.error("database_query_failed", result=result)
                 return False
 
-            self.logger.debug("connection_health_ok")
+            self._last_deep_health_check = now
+            if self._debug_enabled():
+                self.logger.debug("connection_health_ok")
             return True
 
-        except Exception as e:
+        except asyncio.TimeoutError:
+            self.logger.error(
+                "database_health_check_timeout",
+                timeout_seconds=self._db_health_timeout,
+            )
+            await self._log_critical_event(
+                "DATABASE_HEALTH_TIMEOUT",
+                f"Database health check timed out after {self._db_health_timeout}s"
+            )
+            return False
+
+        except _DB_ERRORS as e:
             self.logger.error("connection_health_check_error", error=str(e), exc_info=True)
             await self._log_critical_event(
                 "CONNECTION_HEALTH_CHECK_FAILED",
@@ -233,7 +539,7 @@ class SafetyMonitor:
                         self.logger.warning(
                             "position_close_succeeded_after_retry",
                             symbol=symbol,
-                            size=float(size),
+                            size=size,
                             side=close_side,
                             attempt=attempt + 1,
                             total_attempts=max_retries,
@@ -243,14 +549,34 @@ class SafetyMonitor:
 
                 # Failed but no exception - retry
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(0.5 * (2 ** attempt))
+                    await asyncio.sleep(_retry_backoff(attempt))
             except Exception as e:
                 if attempt == max_retries - 1:
                     return False, str(e)
-                await asyncio.sleep(0.5 * (2 ** attempt))
+                await asyncio.sleep(_retry_backoff(attempt))
 
         return False, "Max retries exceeded"
 
+    async def _emergency_close_one(
+        self, semaphore: asyncio.Semaphore, symbol: str, size: Decimal, close_side: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Close one position during emergency shutdown, bounded by a semaphore.
+
+        Args:
+            semaphore: Limits how many positions are closed at once
+            symbol: Trading symbol
+            size: Position size to close
+            close_side: Side to close position ("Buy" or "Sell")
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        async with semaphore:
+            return await self._close_position_with_retry(
+                symbol, size, close_side, max_retries=3
+            )
+
     async def emergency_shutdown(self) -> None:
         """
         Execute emergency shutdown procedures with forced position closing.
@@ -270,6 +596,8 @@ class SafetyMonitor:
 
         self._emergency_shutdown = True
         self._trading_enabled = False
+        self._refresh_trading_enabled()
+        self._balance_cache = None
 
         self.logger.critical("emergency_shutdown_initiated")
 
@@ -277,7 +605,8 @@ class SafetyMonitor:
             # Log critical event
             await self._log_critical_event(
                 "EMERGENCY_SHUTDOWN",
-                "Emergency shutdown initiated - closing all positions"
+                "Emergency shutdown initiated - closing all positions",
+                durable=True,
             )
 
             # CRITICAL: Close ALL open positions
@@ -306,8 +635,8 @@ class SafetyMonitor:
                             f"Failed to fetch open positions after {fetch_max_retries} attempts: {str(e)}"
                         )
                     else:
-                        # Retry with exponential backoff
-                        backoff_time = 0.5 * (2 ** fetch_attempt)
+                        # Retry with jittered exponential backoff
+                        backoff_time = _retry_backoff(fetch_attempt)
                         self.logger.warning(
                             "emergency_fetch_positions_retry",
                             attempt=fetch_attempt + 1,
@@ -340,7 +669,8 @@ class SafetyMonitor:
                 )
                 await self._log_critical_event(
                     "EMERGENCY_NO_POSITIONS_ANOMALY",
-                    "Emergency shutdown triggered by capital loss (10%) but no positions found on exchange"
+                    "Emergency shutdown triggered by capital loss (10%) but no positions found on exchange",
+                    durable=True,
                 )
                 raise RuntimeError(
                     "ANOMALY: Emergency shutdown triggered by capital loss but no open positions found on exchange. "
@@ -352,6 +682,7 @@ class SafetyMonitor:
             if exchange_positions:
                 close_tasks = []
                 position_details = []
+                semaphore = asyncio.Semaphore(self.emergency_close_concurrency)
 
                 for pos_data in exchange_positions:
                     symbol = pos_data.get('symbol', '')
@@ -374,10 +705,11 @@ class SafetyMonitor:
 
                     # Create close task with retry logic
                     close_tasks.append(
-                        self._close_position_with_retry(symbol, size, close_side, max_retries=3)
+                        self._emergency_close_one(semaphore, symbol, size, close_side)
                     )
 
-                # Execute all close operations in parallel
+                # Execute all close operations in parallel (at most
+                # emergency_close_concurrency requests in flight)
                 results = await asyncio.gather(*close_tasks, return_exceptions=True)
 
                 # Process results
@@ -395,7 +727,7 @@ class SafetyMonitor:
                         self.logger.critical(
                             "emergency_position_close_error",
                             symbol=symbol,
-                            size=float(size),
+                            size=size,
                             side=close_side,
                             error=error_msg,
                             exc_info=True,
@@ -408,7 +740,7 @@ class SafetyMonitor:
                             self.logger.critical(
                                 "emergency_position_closed",
                                 symbol=symbol,
-                                size=float(size),
+                                size=size,
                                 side=close_side,
                             )
                         else:
@@ -417,7 +749,7 @@ class SafetyMonitor:
                             self.logger.critical(
                                 "emergency_position_close_failed",
                                 symbol=symbol,
-                                size=float(size),
+                                size=size,
                                 side=close_side,
                                 error=error_message,
                             )
@@ -425,7 +757,8 @@ class SafetyMonitor:
             # Log final results to database
             await self._log_critical_event(
                 "EMERGENCY_POSITIONS_CLOSED",
-                f"Closed {closed_count} positions, failed {failed_count}"
+                f"Closed {closed_count} positions, failed {failed_count}",
+                durable=True,
             )
 
             # Conditional logging based on outcome
@@ -470,6 +803,7 @@ class SafetyMonitor:
             return
 
         self._trading_enabled = False
+        self._refresh_trading_enabled()
 
         self.logger.warning("trading_disabled")
 
@@ -495,6 +829,7 @@ class SafetyMonitor:
             return
 
         self._trading_enabled = True
+        self._refresh_trading_enabled()
 
         self.logger.info("trading_enabled")
 
@@ -503,28 +838,117 @@ class SafetyMonitor:
             "Trading re-enabled after safety verification"
         )
 
-    async def _log_critical_event(self, event_type: str, message: str) -> None:
+    async def start(self) -> None:
+        """Start the background critical event writer."""
+        if self._event_task is None:
+            self._event_task = asyncio.create_task(self._event_writer())
+
+    async def stop(self) -> None:
+        """Write any queued critical events and stop the background writer."""
+        if self._event_task:
+            self._event_task.cancel()
+            try:
+                await self._event_task
+            except asyncio.CancelledError:
+                pass
+            self._event_task = None
+
+        await self._write_events(self._drain_events([]))
+
+    async def _event_writer(self) -> None:
+        """Write queued critical events to the database, batching any backlog."""
+        while True:
+            events = self._drain_events([await self._event_queue.get()])
+            await self._write_events(events)
+
+    def _drain_events(self, events: list[SystemEvent]) -> list[SystemEvent]:
+        """
+        Move every event already waiting in the queue into a batch.
+
+        Args:
+            events: Batch to extend
+
+        Returns:
+            The extended batch
+        """
+        queue = self._event_queue
+        while not queue.empty():
+            events.append(queue.get_nowait())
+        return events
+
+    async def _log_critical_event(
+        self, event_type: str, message: str, durable: bool = False
+    ) -> None:
         """
         Log critical event to database.
 
+        Events are queued for the background writer so safety decisions do
+        not wait on the database; durable events (emergency shutdown) and
+        events logged while the writer is not running are written inline.
+
         Args:
             event_type: Type of critical event
             message: Event message
+            durable: Write the event before returning
         """
+        event = self._critical_event_template.model_copy(
+            update={
+                "event_type": event_type,
+                "message": message,
+                "timestamp": datetime.now(),
+            }
+        )
+
+        if durable or self._event_task is None:
+            await self._write_event(event)
+            return
+
         try:
-            event = SystemEvent(
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.logger.error(
+                "critical_event_queue_full",
                 event_type=event_type,
-                severity=EVENT_SEVERITY_CRITICAL,
                 message=message,
-                timestamp=datetime.now(),
             )
+
+    async def _write_event(self, event: SystemEvent) -> None:
+        """
+        Write one critical event to the database, logging any failure.
+
+        Args:
+            event: Event to write
+        """
+        try:
             await self.db_manager.log_event(event)
 
         except Exception as e:
             self.logger.error(
                 "failed_to_log_critical_event",
-                event_type=event_type,
-                message=message,
+                event_type=event.event_type,
+                message=event.message,
+                error=str(e),
+                exc_info=True,
+            )
+
+    async def _write_events(self, events: list[SystemEvent]) -> None:
+        """
+        Write a batch of critical events in one INSERT, logging any failure.
+
+        Args:
+            events: Events to write
+        """
+        if len(events) == 1:
+            await self._write_event(events[0])
+            return
+
+        try:
+            await self.db_manager.log_events(events)
+
+        except Exception as e:
+            self.logger.error(
+                "failed_to_log_critical_events",
+                event_types=[event.event_type for event in events],
                 error=str(e),
                 exc_info=True,
             )
@@ -536,7 +960,15 @@ class SafetyMonitor:
         Returns:
             True if trading is enabled, False otherwise
         """
-        return self._trading_enabled and not self._emergency_shutdown
+        return self._effective_enabled
+
+    def _refresh_trading_enabled(self) -> None:
+        """Recompute the trading flag after any of its inputs change."""
+        self._effective_enabled = (
+            self._trading_enabled
+            and not self._emergency_shutdown
+            and self._circuit_state == _CIRCUIT_CLOSED
+        )
 
     def is_emergency_shutdown(self) -> bool:
         """
@@ -557,7 +989,8 @@ class SafetyMonitor:
         return {
             "trading_enabled": self._trading_enabled,
             "emergency_shutdown": self._emergency_shutdown,
-            "last_balance_check": self._last_balance_check.isoformat() if self._last_balance_check else None,
-            "initial_balance": float(self.initial_balance),
-            "max_loss_percent": float(self.max_loss_percent),
+            "circuit_state": self._circuit_state,
+            "consecutive_failures": self._consecutive_failures,
+            "last_balance_check": self._get_last_balance_check_iso(),
+            **self._static_status,
         }
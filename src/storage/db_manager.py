@@ -12,11 +12,12 @@ import asyncio
 import json
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
 from uuid import UUID
 
 import asyncpg
 from asyncpg import Pool, Record
+from asyncpg.pool import PoolAcquireContext
 
 from src.utils.logger import get_logger
 
@@ -50,6 +51,7 @@ class CoinParametersCache:
         self._cache: dict[str, CoinParameters] = {}
         self._lock = asyncio.Lock()
         self._refresh_task: Optional[asyncio.Task] = None
+        self._subscribers: dict[str, list[Callable[[CoinParameters], None]]] = {}
 
     async def start(self) -> None:
         """Start the cache refresh task."""
@@ -81,8 +83,14 @@ class CoinParametersCache:
         """Refresh all parameters from database."""
         async with self._lock:
             params_list = await self.db_manager.get_all_coin_parameters()
+            old_cache = self._cache
             self._cache = {params.symbol: params for params in params_list}
 
+        for symbol in self._subscribers:
+            params = self._cache.get(symbol)
+            if params is not None and params != old_cache.get(symbol):
+                self._notify(params)
+
     async def get(self, symbol: str) -> Optional[CoinParameters]:
         """
         Get parameters for a symbol.
@@ -107,6 +115,8 @@ class CoinParametersCache:
             await self.db_manager.upsert_coin_parameters(params)
             self._cache[params.symbol] = params
 
+        self._notify(params)
+
     def get_sync(self, symbol: str) -> Optional[CoinParameters]:
         """
         Synchronously get parameters (no lock - use carefully).
@@ -119,6 +129,52 @@ class CoinParametersCache:
         """
         return self._cache.get(symbol)
 
+    def get_sync_many(self, symbols: Iterable[str]) -> dict[str, CoinParameters]:
+        """
+        Synchronously get parameters for several symbols (no lock).
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Dict of symbol -> CoinParameters (unknown symbols are omitted)
+        """
+        cache = self._cache
+        return {symbol: cache[symbol] for symbol in symbols if symbol in cache}
+
+    def subscribe(
+        self, symbol: str, callback: Callable[[CoinParameters], None]
+    ) -> None:
+        """
+        Register a callback invoked with new parameters when a symbol changes.
+
+        Args:
+            symbol: Trading symbol
+            callback: Called with the updated CoinParameters
+        """
+        self._subscribers.setdefault(symbol, []).append(callback)
+
+    def unsubscribe(
+        self, symbol: str, callback: Callable[[CoinParameters], None]
+    ) -> None:
+        """
+        Remove a callback registered with subscribe().
+
+        Args:
+            symbol: Trading symbol
+            callback: Previously registered callback
+        """
+        callbacks = self._subscribers.get(symbol)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._subscribers[symbol]
+
+    def _notify(self, params: CoinParameters) -> None:
+        """Invoke subscribers for a symbol whose parameters changed."""
+        for callback in self._subscribers.get(params.symbol, ()):
+            callback(params)
+
 
 class DatabaseManager:
     """
@@ -186,6 +242,31 @@ class DatabaseManager:
             await self.pool.close()
             self.pool = None
 
+    def acquire(self, timeout: Optional[float] = None) -> PoolAcquireContext:
+        """
+        Acquire a pooled connection as an async context manager.
+
+        The connection is returned to the pool when the block exits,
+        including when it exits with an exception.
+
+        Example:
+            >>> async with db_manager.acquire() as conn:
+            ...     await conn.fetch("SELECT 1")
+
+        Args:
+            timeout: Seconds to wait for a free connection
+
+        Returns:
+            Async context manager yielding a connection
+
+        Raises:
+            RuntimeError: If the database is not connected
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected")
+
+        return self.pool.acquire(timeout=timeout)
+
     async def execute(
         self,
         query: str,
@@ -214,7 +295,7 @@ class DatabaseManager:
         last_error = None
         for attempt in range(retry_count):
             try:
-                async with self.pool.acquire() as conn:
+                async with self.acquire() as conn:
                     return await conn.execute(query, *args, timeout=timeout)
             except Exception as e:
                 last_error = e
@@ -251,7 +332,7 @@ class DatabaseManager:
         last_error = None
         for attempt in range(retry_count):
             try:
-                async with self.pool.acquire() as conn:
+                async with self.acquire() as conn:
                     return await conn.fetch(query, *args, timeout=timeout)
             except Exception as e:
                 last_error = e
@@ -288,7 +369,7 @@ class DatabaseManager:
         last_error = None
         for attempt in range(retry_count):
             try:
-                async with self.pool.acquire() as conn:
+                async with self.acquire() as conn:
                     return await conn.fetchrow(query, *args, timeout=timeout)
             except Exception as e:
                 last_error = e
@@ -327,7 +408,7 @@ class DatabaseManager:
         last_error = None
         for attempt in range(retry_count):
             try:
-                async with self.pool.acquire() as conn:
+                async with self.acquire() as conn:
                     return await conn.fetchval(query, *args, column=column, timeout=timeout)
             except Exception as e:
                 last_error = e
@@ -709,22 +790,52 @@ class DatabaseManager:
             reason=reason.value,
         )
 
+    async def mark_trades_closing(self, reasons: dict[UUID, ExitReason]) -> None:
+        """
+        Mark several trade records as closing in a single UPDATE.
+
+        Args:
+            reasons: Exit reason per trade id
+        """
+        if not reasons:
+            return
+
+        query = """
+            UPDATE trades
+            SET status = $1, exit_reason = r.reason, updated_at = NOW()
+            FROM unnest($2::uuid[], $3::text[]) AS r(id, reason)
+            WHERE trades.id = r.id
+        """
+
+        await self.execute(
+            query,
+            PositionStatus.CLOSING.value,
+            list(reasons.keys()),
+            [reason.value for reason in reasons.values()],
+            timeout=5.0,
+        )
+
+        self.logger.info("trades_marked_closing", count=len(reasons))
+
     async def get_open_trades(self) -> list[dict]:
         """
         Get all open trade records from database.
 
+        Trades marked closing are included: they are still open on the
+        exchange until the close order goes through.
+
         Returns:
             List of dictionaries with trade data
         """
         query = """
             SELECT * FROM trades
-            WHERE status = $1
+            WHERE status = ANY($1::text[])
             ORDER BY entry_time DESC
         """
 
         rows = await self.fetch(
             query,
-            PositionStatus.OPEN.value,
+            [PositionStatus.OPEN.value, PositionStatus.CLOSING.value],
             timeout=10.0,
         )
 
@@ -897,6 +1008,40 @@ class DatabaseManager:
             event.message,
         )
 
+    async def log_events(self, events: list[SystemEvent]) -> None:
+        """
+        Log several system events with a single multi-row INSERT.
+
+        Args:
+            events: System events to log
+        """
+        if not events:
+            return
+
+        rows = []
+        args: list[Any] = []
+        for event in events:
+            base = len(args)
+            rows.append(
+                "(" + ", ".join(f"${base + column}" for column in range(1, 7)) + ")"
+            )
+            args.extend((
+                event.timestamp,
+                event.event_type,
+                event.severity,
+                event.symbol,
+                json.dumps(event.details) if event.details else None,
+                event.message,
+            ))
+
+        await self.execute(
+            """
+            INSERT INTO system_events (
+                time, event_type, severity, symbol, details, message
+            ) VALUES """ + ", ".join(rows),
+            *args,
+        )
+
     async def get_recent_events(
         self, limit: int = 100, severity: Optional[str] = None
     ) -> list[SystemEvent]:
@@ -10,11 +10,24 @@ This module defines all data models used throughout the application:
 
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntFlag
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+_HUNDRED = Decimal(100)
+
+# Tolerance for matching Decimal price levels
+_PRICE_EPSILON = Decimal("0.00000001")
+
+# Fixed-point scale for integer price comparisons (8 decimal places)
+PRICE_SCALE = 10**8
+_PRICE_SCALE_DECIMAL = Decimal(PRICE_SCALE)
 
 
 # ==================== Enums ====================
@@ -76,6 +89,21 @@ class PositionDirection(str, Enum):
     SHORT = "SHORT"
 
 
+class StrategyFlags(IntFlag):
+    """Enabled strategies as a bitmask (derived from preferred_strategy)."""
+
+    BREAKOUT = 1
+    BOUNCE = 2
+    BOTH = BREAKOUT | BOUNCE
+
+
+_STRATEGY_FLAGS = {
+    "breakout": StrategyFlags.BREAKOUT,
+    "bounce": StrategyFlags.BOUNCE,
+    "both": StrategyFlags.BOTH,
+}
+
+
 # ==================== Order Book Models ====================
 
 
@@ -123,26 +151,64 @@ class OrderBook(BaseModel):
     asks: list[PriceLevel] = Field(default_factory=list, description="Ask price levels")
     timestamp: datetime = Field(default_factory=datetime.now, description="When snapshot was taken")
 
+    # Float64 volume arrays per side, built on first use (snapshots are not mutated)
+    _volume_arrays: dict[OrderSide, np.ndarray] = PrivateAttr(default_factory=dict)
+    _total_volumes_f: dict[OrderSide, float] = PrivateAttr(default_factory=dict)
+    _mid_price: Optional[Decimal] = PrivateAttr(default=None)
+    _mid_price_f: Optional[float] = PrivateAttr(default=None)
+
     def get_mid_price(self) -> Optional[Decimal]:
-        """Calculate mid price between best bid and ask."""
-        if not self.bids or not self.asks:
-            return None
-        best_bid = max(self.bids, key=lambda x: x.price)
-        best_ask = min(self.asks, key=lambda x: x.price)
-        return (best_bid.price + best_ask.price) / 2
+        """Calculate mid price between best bid and ask (computed once per snapshot)."""
+        if self._mid_price is None:
+            if not self.bids or not self.asks:
+                return None
+            best_bid = max(self.bids, key=lambda x: x.price)
+            best_ask = min(self.asks, key=lambda x: x.price)
+            self._mid_price = (best_bid.price + best_ask.price) / 2
+        return self._mid_price
+
+    def get_mid_price_float(self) -> Optional[float]:
+        """Mid price as float (computed once per snapshot)."""
+        if self._mid_price_f is None:
+            mid_price = self.get_mid_price()
+            if mid_price is None:
+                return None
+            self._mid_price_f = float(mid_price)
+        return self._mid_price_f
 
     def get_total_volume(self, side: OrderSide) -> Decimal:
         """Get total volume for a side of the order book."""
         levels = self.bids if side == OrderSide.BID else self.asks
         return sum(level.volume for level in levels)
 
+    def get_volume_array(self, side: OrderSide) -> np.ndarray:
+        """Get volumes for a side of the order book as a float64 array."""
+        volumes = self._volume_arrays.get(side)
+        if volumes is None:
+            levels = self.bids if side == OrderSide.BID else self.asks
+            volumes = np.fromiter(
+                (float(level.volume) for level in levels),
+                dtype=np.float64,
+                count=len(levels),
+            )
+            self._volume_arrays[side] = volumes
+        return volumes
+
+    def get_total_volume_float(self, side: OrderSide) -> float:
+        """Get total volume for a side as a float (computed once per snapshot)."""
+        total = self._total_volumes_f.get(side)
+        if total is None:
+            total = float(self.get_volume_array(side).sum())
+            self._total_volumes_f[side] = total
+        return total
+
     def get_volume_at_level(self, price: Decimal, side: OrderSide) -> Decimal:
         """Get volume at a specific price level."""
         levels = self.bids if side == OrderSide.BID else self.asks
-        for level in levels:
-            if abs(level.price - price) < Decimal("0.00000001"):  # Float comparison tolerance
-                return level.volume
-        return Decimal("0")
+        return next(
+            (level.volume for level in levels if abs(level.price - price) < _PRICE_EPSILON),
+            _ZERO,
+        )
 
     class Config:
         json_encoders = {
@@ -168,12 +234,34 @@ class Density(BaseModel):
     appeared_at: datetime = Field(default_factory=datetime.now, description="When density first appeared")
     disappeared_at: Optional[datetime] = Field(None, description="When density disappeared")
 
+    # Erosion as float, stored once per orderbook update by the tracker
+    _erosion: Optional[float] = PrivateAttr(default=None)
+    _price_scaled: Optional[int] = PrivateAttr(default=None)
+
     def erosion_percent(self) -> Decimal:
         """Calculate percentage of density that has been eroded."""
         if self.initial_volume <= 0:
-            return Decimal("0")
+            return _ZERO
         return ((self.initial_volume - self.volume) / self.initial_volume) * 100
 
+    @property
+    def erosion_cached(self) -> float:
+        """Erosion percentage as float, computed at most once per update."""
+        if self._erosion is None:
+            self._erosion = float(self.erosion_percent())
+        return self._erosion
+
+    def cache_erosion(self, erosion: float) -> None:
+        """Store a precomputed erosion percentage (see erosion_cached)."""
+        self._erosion = erosion
+
+    @property
+    def price_scaled(self) -> int:
+        """Price level as an integer scaled by PRICE_SCALE."""
+        if self._price_scaled is None:
+            self._price_scaled = int(self.price_level * _PRICE_SCALE_DECIMAL)
+        return self._price_scaled
+
     class Config:
         json_encoders = {
             Decimal: str,
@@ -245,6 +333,25 @@ class Position(BaseModel):
     density_price: Decimal = Field(..., description="Price of the density that triggered this")
     signal_priority: Decimal = Field(..., description="Priority of the signal")
 
+    _density_side: Optional[OrderSide] = PrivateAttr(default=None)
+    _density_price_f: Optional[float] = PrivateAttr(default=None)
+
+    @property
+    def density_side(self) -> OrderSide:
+        """Order book side of the triggering density (BID for LONG, ASK for SHORT)."""
+        if self._density_side is None:
+            self._density_side = (
+                OrderSide.BID if self.direction == PositionDirection.LONG else OrderSide.ASK
+            )
+        return self._density_side
+
+    @property
+    def density_price_f(self) -> float:
+        """Triggering density price as float (for hot-path comparisons)."""
+        if self._density_price_f is None:
+            self._density_price_f = float(self.density_price)
+        return self._density_price_f
+
     def calculate_profit_percent(self, current_price: Decimal) -> Decimal:
         """Calculate current profit percentage."""
         price_diff = current_price - self.entry_price
@@ -424,6 +531,18 @@ class CoinParameters(BaseModel):
         default=4,
         description="Hours to look back for local extrema"
     )
+    tp_velocity_slowdown_threshold: float = Field(
+        default=0.5,
+        description="Short/long velocity ratio below which momentum has slowed"
+    )
+    tp_imbalance_change_threshold: float = Field(
+        default=2.0,
+        description="Bid/ask imbalance change factor for aggressive counter orders"
+    )
+    tp_counter_density_distance_percent: float = Field(
+        default=0.3,
+        description="Max distance from price (%) of a counter density that triggers an exit"
+    )
 
     # Strategy preferences
     preferred_strategy: str = Field(
@@ -438,14 +557,66 @@ class CoinParameters(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now, description="Last update time")
     notes: Optional[str] = Field(None, description="Notes about parameters for this coin")
 
+    # Derived at load time
+    _strategy_flags: StrategyFlags = PrivateAttr(default=StrategyFlags.BOTH)
+    _breakout_breakeven_bps: float = PrivateAttr(default=50.0)
+    _breakout_sl_mul_long: Decimal = PrivateAttr(default=_ONE)
+    _breakout_sl_mul_short: Decimal = PrivateAttr(default=_ONE)
+    _bounce_sl_mul_long: Decimal = PrivateAttr(default=_ONE)
+    _bounce_sl_mul_short: Decimal = PrivateAttr(default=_ONE)
+
     @field_validator("preferred_strategy")
     @classmethod
     def validate_strategy(cls, v: str) -> str:
         """Ensure strategy is valid."""
-        if v not in ["breakout", "bounce", "both"]:
+        if v not in _STRATEGY_FLAGS:
             raise ValueError("Strategy must be 'breakout', 'bounce', or 'both'")
         return v
 
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute derived values once parameters are loaded."""
+        self._strategy_flags = _STRATEGY_FLAGS[self.preferred_strategy]
+        # Float keeps fractional basis points (0.125% -> 12.5 bps)
+        self._breakout_breakeven_bps = float(self.breakout_breakeven_profit_percent * _HUNDRED)
+
+        # Stop-loss price multipliers (LONG stops below, SHORT stops above)
+        breakout_offset = self.breakout_min_stop_loss_percent / _HUNDRED
+        bounce_offset = self.bounce_stop_loss_behind_density_percent / _HUNDRED
+        self._breakout_sl_mul_long = _ONE - breakout_offset
+        self._breakout_sl_mul_short = _ONE + breakout_offset
+        self._bounce_sl_mul_long = _ONE - bounce_offset
+        self._bounce_sl_mul_short = _ONE + bounce_offset
+
+    @property
+    def strategy_flags(self) -> StrategyFlags:
+        """Enabled strategies as a bitmask."""
+        return self._strategy_flags
+
+    @property
+    def breakout_breakeven_bps(self) -> float:
+        """Breakout breakeven profit threshold in basis points."""
+        return self._breakout_breakeven_bps
+
+    @property
+    def breakout_sl_mul_long(self) -> Decimal:
+        """Breakout LONG stop-loss multiplier applied to the density level."""
+        return self._breakout_sl_mul_long
+
+    @property
+    def breakout_sl_mul_short(self) -> Decimal:
+        """Breakout SHORT stop-loss multiplier applied to the density level."""
+        return self._breakout_sl_mul_short
+
+    @property
+    def bounce_sl_mul_long(self) -> Decimal:
+        """Bounce LONG stop-loss multiplier applied to the density level."""
+        return self._bounce_sl_mul_long
+
+    @property
+    def bounce_sl_mul_short(self) -> Decimal:
+        """Bounce SHORT stop-loss multiplier applied to the density level."""
+        return self._bounce_sl_mul_short
+
     class Config:
         json_encoders = {
             Decimal: str,
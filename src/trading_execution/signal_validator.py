@@ -227,12 +227,9 @@ class SignalValidator:
             )
 
         # 9. Check density still exists
-        densities = self.orderbook_manager.get_current_densities(signal.symbol)
-        density_exists = any(
-            abs(d.price_level - signal.density.price_level) < Decimal("0.00000001")
-            and d.side == signal.density.side
-            for d in densities
-        )
+        density_exists = self.orderbook_manager.get_density(
+            signal.symbol, signal.density.side, signal.density.price_level
+        ) is not None
         if not density_exists:
             reason = "Density no longer exists in orderbook"
             self.logger.warning(
@@ -241,7 +238,9 @@ class SignalValidator:
                 signal_id=str(signal.id),
                 density_price=float(signal.density.price_level),
                 density_side=signal.density.side.value,
-                current_densities_count=len(densities),
+                current_densities_count=len(
+                    self.orderbook_manager.get_current_densities(signal.symbol)
+                ),
                 reason=reason,
             )
             return False, reason
@@ -8,13 +8,35 @@ for production and human-readable output for development.
 import logging
 import logging.handlers
 import sys
+from decimal import Decimal
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from uuid import UUID
 
 import structlog
 from pythonjsonlogger import jsonlogger
 
 
+def coerce_log_values(
+    logger: Any, method_name: str, event_dict: dict
+) -> dict:
+    """
+    Convert Decimal, UUID and Enum values to JSON-friendly types.
+
+    Runs only for events that pass the level filter, so call sites can pass
+    raw Decimal/UUID/Enum values instead of converting them eagerly.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, Decimal):
+            event_dict[key] = float(value)
+        elif isinstance(value, UUID):
+            event_dict[key] = str(value)
+        elif isinstance(value, Enum):
+            event_dict[key] = value.value
+    return event_dict
+
+
 def setup_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -45,9 +67,10 @@ def setup_logger(
         structlog.processors.UnicodeDecoder(),
     ]
 
-    # Configure structlog
+    # Configure structlog (drop filtered events before running any processor)
     structlog.configure(
-        processors=shared_processors + [
+        processors=[structlog.stdlib.filter_by_level] + shared_processors + [
+            coerce_log_values,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         context_class=dict,
@@ -0,0 +1,78 @@
+"""
+Tests for the price/volume history ring buffer.
+"""
+
+import numpy as np
+
+from src.data_collection.orderbook_manager import _HistoryBuffer
+
+
+def test_empty_window():
+    buffer = _HistoryBuffer(capacity=4, columns=2)
+
+    rows = buffer.window(0.0)
+    assert rows.shape == (2, 0)
+
+
+def test_window_before_wrap_keeps_order():
+    buffer = _HistoryBuffer(capacity=4, columns=2)
+    for t in range(3):
+        buffer.append(float(t), 100.0 + t)
+
+    timestamps, prices = buffer.window(0.0)
+    assert timestamps.tolist() == [0.0, 1.0, 2.0]
+    assert prices.tolist() == [100.0, 101.0, 102.0]
+
+
+def test_wrap_around_drops_oldest_rows():
+    buffer = _HistoryBuffer(capacity=4, columns=2)
+    for t in range(10):
+        buffer.append(float(t), 100.0 + t)
+
+    timestamps, prices = buffer.window(0.0)
+    assert timestamps.tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert prices.tolist() == [106.0, 107.0, 108.0, 109.0]
+
+
+def test_wrap_around_at_every_head_position():
+    capacity = 5
+    buffer = _HistoryBuffer(capacity=capacity, columns=2)
+    for t in range(3 * capacity):
+        buffer.append(float(t), float(-t))
+
+        expected = [float(x) for x in range(max(0, t - capacity + 1), t + 1)]
+        timestamps, values = buffer.window(-1.0)
+        assert timestamps.tolist() == expected
+        assert values.tolist() == [-x for x in expected]
+
+
+def test_window_filters_by_timestamp():
+    buffer = _HistoryBuffer(capacity=4, columns=3)
+    for t in range(7):
+        buffer.append(float(t), 10.0 * t, 20.0 * t)
+
+    timestamps, bids, asks = buffer.window(4.5)
+    assert timestamps.tolist() == [5.0, 6.0]
+    assert bids.tolist() == [50.0, 60.0]
+    assert asks.tolist() == [100.0, 120.0]
+
+    # Cutoff equal to a timestamp includes that row
+    timestamps, _, _ = buffer.window(5.0)
+    assert timestamps.tolist() == [5.0, 6.0]
+
+    # Cutoff after the newest row returns nothing
+    timestamps, _, _ = buffer.window(7.0)
+    assert timestamps.tolist() == []
+
+
+def test_window_is_a_copy():
+    buffer = _HistoryBuffer(capacity=3, columns=2)
+    for t in range(3):
+        buffer.append(float(t), 1.0)
+
+    rows = buffer.window(0.0)
+    buffer.append(3.0, 2.0)
+    buffer.append(4.0, 2.0)
+
+    assert rows[0].tolist() == [0.0, 1.0, 2.0]
+    assert np.all(rows[1] == 1.0)
@@ -0,0 +1,98 @@
+"""
+Tests for the position monitoring numeric kernels.
+"""
+
+import math
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.position_management import _kernels
+from src.storage.models import CoinParameters, Position, PositionDirection, SignalType
+
+
+def make_position(direction: PositionDirection, entry_price: Decimal, leverage: int) -> Position:
+    return Position(
+        symbol="BTCUSDT",
+        entry_price=entry_price,
+        size=Decimal("1"),
+        leverage=leverage,
+        direction=direction,
+        signal_type=SignalType.BREAKOUT,
+        stop_loss=entry_price,
+        density_price=entry_price,
+        signal_priority=Decimal("1"),
+    )
+
+
+def kernel_reached(position: Position, price: Decimal, params: CoinParameters) -> bool:
+    sign = 1.0 if position.direction == PositionDirection.LONG else -1.0
+    mask = _kernels.breakeven_mask(
+        np.array([float(price)]),
+        np.array([float(position.entry_price)]),
+        np.array([sign]),
+        np.array([float(position.leverage)]),
+        np.array([params.breakout_breakeven_bps]),
+        np.array([True]),
+    )
+    return bool(mask[0])
+
+
+def decimal_reached(position: Position, price: Decimal, params: CoinParameters) -> bool:
+    return position.calculate_profit_percent(price) >= params.breakout_breakeven_profit_percent
+
+
+BOUNDARY_CASES = [
+    # (entry, tick, leverage, threshold %)
+    ("100", "0.01", 10, "0.5"),
+    ("27000.1", "0.1", 1, "0.5"),
+    ("3.3", "0.0001", 2, "0.25"),
+    ("0.1234", "0.00001", 1, "0.125"),
+    ("1843.27", "0.01", 5, "0.125"),
+    ("64000", "0.5", 25, "1.0"),
+    ("0.5432", "0.0001", 20, "0.2"),
+]
+
+
+@pytest.mark.parametrize("direction", [PositionDirection.LONG, PositionDirection.SHORT])
+@pytest.mark.parametrize("entry,tick,leverage,threshold", BOUNDARY_CASES)
+def test_breakeven_mask_matches_decimal_at_threshold(direction, entry, tick, leverage, threshold):
+    entry_price = Decimal(entry)
+    tick_size = Decimal(tick)
+    position = make_position(direction, entry_price, leverage)
+    params = CoinParameters(
+        symbol="BTCUSDT", breakout_breakeven_profit_percent=Decimal(threshold)
+    )
+
+    sign = 1 if direction == PositionDirection.LONG else -1
+    move = entry_price * Decimal(threshold) / 100 / leverage
+    boundary = (entry_price + sign * move).quantize(tick_size)
+
+    for offset in range(-2, 3):
+        price = boundary + offset * tick_size
+        assert kernel_reached(position, price, params) == decimal_reached(
+            position, price, params
+        ), f"price={price}"
+
+
+def test_breakeven_mask_exact_threshold_counts_as_reached():
+    # 100 -> 100.05 at 10x is exactly 0.5% (50 bps)
+    position = make_position(PositionDirection.LONG, Decimal("100"), 10)
+    params = CoinParameters(symbol="BTCUSDT", breakout_breakeven_profit_percent=Decimal("0.5"))
+
+    assert decimal_reached(position, Decimal("100.05"), params)
+    assert kernel_reached(position, Decimal("100.05"), params)
+    assert not kernel_reached(position, Decimal("100.04"), params)
+
+
+def test_breakeven_mask_skips_missing_prices_and_settled_positions():
+    mask = _kernels.breakeven_mask(
+        np.array([math.nan, 101.0, 101.0]),
+        np.array([100.0, 100.0, 100.0]),
+        np.array([1.0, 1.0, 1.0]),
+        np.array([1.0, 1.0, 1.0]),
+        np.array([50.0, 50.0, 50.0]),
+        np.array([True, False, True]),
+    )
+    assert mask.tolist() == [False, False, True]
@@ -0,0 +1,395 @@
+"""
+Tests for PositionMonitor exit checks and breakeven stop-loss updates.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from src.data_collection.orderbook_manager import OrderBookManager
+from src.position_management.position_monitor import PositionMonitor
+from src.storage.models import (
+    CoinParameters,
+    Density,
+    ExitReason,
+    OrderBook,
+    OrderSide,
+    Position,
+    PositionDirection,
+    PriceLevel,
+    SignalType,
+)
+
+SYMBOL = "BTCUSDT"
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager with no I/O and an empty params cache."""
+    db = MagicMock()
+    db.save_density = AsyncMock()
+    db.update_density_disappeared = AsyncMock()
+    db.update_trade_stop_loss = AsyncMock()
+    db.coin_params_cache.get_sync.return_value = None
+    return db
+
+
+@pytest.fixture
+def orderbook_manager(db_manager):
+    return OrderBookManager(db_manager)
+
+
+@pytest.fixture
+def monitor(db_manager, orderbook_manager):
+    return PositionMonitor(db_manager, orderbook_manager)
+
+
+@pytest.fixture
+def params():
+    return CoinParameters(symbol=SYMBOL)
+
+
+def make_orderbook(bid: str, ask: str) -> OrderBook:
+    return OrderBook(
+        symbol=SYMBOL,
+        bids=[PriceLevel(price=Decimal(bid), volume=Decimal("10"))],
+        asks=[PriceLevel(price=Decimal(ask), volume=Decimal("10"))],
+    )
+
+
+def make_density(
+    side: OrderSide, price: str, volume: str = "100", initial_volume: str = "100"
+) -> Density:
+    return Density(
+        symbol=SYMBOL,
+        price_level=Decimal(price),
+        volume=Decimal(volume),
+        initial_volume=Decimal(initial_volume),
+        side=side,
+    )
+
+
+def make_position(
+    direction: PositionDirection,
+    signal_type: SignalType = SignalType.BREAKOUT,
+    entry_price: str = "100",
+    density_price: str = "99",
+) -> Position:
+    return Position(
+        symbol=SYMBOL,
+        entry_price=Decimal(entry_price),
+        size=Decimal("1"),
+        leverage=10,
+        direction=direction,
+        signal_type=signal_type,
+        stop_loss=Decimal("98"),
+        density_price=Decimal(density_price),
+        signal_priority=Decimal("1"),
+    )
+
+
+async def track(orderbook_manager: OrderBookManager, *densities: Density) -> None:
+    """Make densities the currently tracked set for SYMBOL."""
+    await orderbook_manager._track_density_lifecycle(SYMBOL, list(densities))
+
+
+async def start(monitor: PositionMonitor, position: Position) -> Position:
+    await monitor.start_monitoring(position)
+    return position
+
+
+class TestCounterDensity:
+    """Counter-density exit: nearest density ahead within the distance limit."""
+
+    @pytest.mark.asyncio
+    async def test_long_exits_on_near_ask_density(self, monitor, orderbook_manager, params):
+        # Mid 100.05; ASK density at 100.2 is 0.15% away (limit 0.3%)
+        await track(orderbook_manager, make_density(OrderSide.ASK, "100.2"))
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        checks = monitor._direction_checks[position.id]
+        assert monitor._check_counter_density(position, orderbook, params, checks)
+
+    @pytest.mark.asyncio
+    async def test_long_ignores_far_ask_density(self, monitor, orderbook_manager, params):
+        # ASK densities always sit above mid; one 1% away is not in the way yet
+        await track(orderbook_manager, make_density(OrderSide.ASK, "101.05"))
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        checks = monitor._direction_checks[position.id]
+        assert not monitor._check_counter_density(position, orderbook, params, checks)
+
+    @pytest.mark.asyncio
+    async def test_long_checks_nearest_ask_density(self, monitor, orderbook_manager, params):
+        await track(
+            orderbook_manager,
+            make_density(OrderSide.ASK, "100.2"),
+            make_density(OrderSide.ASK, "105"),
+        )
+
+        density = monitor._find_counter_density_long(
+            SYMBOL, Decimal("100.05"), params.tp_counter_density_distance_percent
+        )
+        assert density is not None
+        assert density.price_level == Decimal("100.2")
+
+    @pytest.mark.asyncio
+    async def test_long_ignores_bid_density(self, monitor, orderbook_manager, params):
+        await track(orderbook_manager, make_density(OrderSide.BID, "100.0"))
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        checks = monitor._direction_checks[position.id]
+        assert not monitor._check_counter_density(position, orderbook, params, checks)
+
+    @pytest.mark.asyncio
+    async def test_short_exits_on_near_bid_density(self, monitor, orderbook_manager, params):
+        await track(
+            orderbook_manager,
+            make_density(OrderSide.BID, "95"),
+            make_density(OrderSide.BID, "99.9"),
+        )
+        position = await start(monitor, make_position(PositionDirection.SHORT))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        density = monitor._find_counter_density_short(
+            SYMBOL, orderbook.get_mid_price(), params.tp_counter_density_distance_percent
+        )
+        assert density is not None
+        assert density.price_level == Decimal("99.9")
+
+        checks = monitor._direction_checks[position.id]
+        assert monitor._check_counter_density(position, orderbook, params, checks)
+
+    @pytest.mark.asyncio
+    async def test_short_ignores_far_bid_density(self, monitor, orderbook_manager, params):
+        await track(orderbook_manager, make_density(OrderSide.BID, "99"))
+        position = await start(monitor, make_position(PositionDirection.SHORT))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        checks = monitor._direction_checks[position.id]
+        assert not monitor._check_counter_density(position, orderbook, params, checks)
+
+    @pytest.mark.asyncio
+    async def test_distance_comes_from_params(self, monitor, orderbook_manager):
+        await track(orderbook_manager, make_density(OrderSide.ASK, "101.05"))
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        orderbook = make_orderbook("100.0", "100.1")
+        wide = CoinParameters(symbol=SYMBOL, tp_counter_density_distance_percent=1.5)
+
+        checks = monitor._direction_checks[position.id]
+        assert monitor._check_counter_density(position, orderbook, wide, checks)
+
+    @pytest.mark.asyncio
+    async def test_far_density_does_not_close_position(
+        self, monitor, orderbook_manager, params
+    ):
+        await track(orderbook_manager, make_density(OrderSide.ASK, "102"))
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        exit_reason = monitor._check_exit_conditions(
+            position, orderbook, orderbook.get_mid_price(), params
+        )
+        assert exit_reason is None
+
+    @pytest.mark.asyncio
+    async def test_near_density_closes_position(self, monitor, orderbook_manager, params):
+        await track(orderbook_manager, make_density(OrderSide.ASK, "100.2"))
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        orderbook = make_orderbook("100.0", "100.1")
+
+        exit_reason = monitor._check_exit_conditions(
+            position, orderbook, orderbook.get_mid_price(), params
+        )
+        assert exit_reason == ExitReason.COUNTER_DENSITY
+
+
+class TestBounceDensity:
+    """Bounce positions track the density they were opened on (BID for LONG, ASK for SHORT)."""
+
+    @pytest.mark.asyncio
+    async def test_intact_density_keeps_position(self, monitor, orderbook_manager, params):
+        await track(orderbook_manager, make_density(OrderSide.BID, "99"))
+        position = await start(
+            monitor, make_position(PositionDirection.LONG, SignalType.BOUNCE)
+        )
+        orderbook = make_orderbook("100.0", "100.1")
+
+        should_move, exit_reason = monitor._evaluate_position_sync(
+            position, orderbook, orderbook.get_mid_price(), params, False
+        )
+        assert not should_move
+        assert exit_reason is None
+
+    @pytest.mark.asyncio
+    async def test_eroded_density_moves_breakeven_and_exits(
+        self, monitor, orderbook_manager, params
+    ):
+        # 70% eroded, past the 65% default
+        await track(
+            orderbook_manager,
+            make_density(OrderSide.BID, "99", volume="30", initial_volume="100"),
+        )
+        position = await start(
+            monitor, make_position(PositionDirection.LONG, SignalType.BOUNCE)
+        )
+        orderbook = make_orderbook("100.0", "100.1")
+
+        should_move, exit_reason = monitor._evaluate_position_sync(
+            position, orderbook, orderbook.get_mid_price(), params, False
+        )
+        assert should_move
+        assert exit_reason == ExitReason.DENSITY_EROSION
+
+    @pytest.mark.asyncio
+    async def test_partly_eroded_density_keeps_position(
+        self, monitor, orderbook_manager, params
+    ):
+        await track(
+            orderbook_manager,
+            make_density(OrderSide.ASK, "101", volume="50", initial_volume="100"),
+        )
+        position = await start(
+            monitor,
+            make_position(PositionDirection.SHORT, SignalType.BOUNCE, density_price="101"),
+        )
+        orderbook = make_orderbook("100.0", "100.1")
+
+        should_move, exit_reason = monitor._evaluate_position_sync(
+            position, orderbook, orderbook.get_mid_price(), params, False
+        )
+        assert not should_move
+        assert exit_reason is None
+
+    @pytest.mark.asyncio
+    async def test_disappeared_density_exits(self, monitor, orderbook_manager, params):
+        await track(orderbook_manager)
+        position = await start(
+            monitor, make_position(PositionDirection.LONG, SignalType.BOUNCE)
+        )
+        orderbook = make_orderbook("100.0", "100.1")
+
+        should_move, exit_reason = monitor._evaluate_position_sync(
+            position, orderbook, orderbook.get_mid_price(), params, False
+        )
+        assert not should_move
+        assert exit_reason == ExitReason.DENSITY_EROSION
+
+    @pytest.mark.asyncio
+    async def test_density_on_other_side_does_not_match(
+        self, monitor, orderbook_manager, params
+    ):
+        # An ASK density at the entry density's price is not the BID support
+        await track(orderbook_manager, make_density(OrderSide.ASK, "99"))
+        position = await start(
+            monitor, make_position(PositionDirection.LONG, SignalType.BOUNCE)
+        )
+        orderbook = make_orderbook("98.9", "99.1")
+
+        _, exit_reason = monitor._evaluate_position_sync(
+            position, orderbook, orderbook.get_mid_price(), params, False
+        )
+        assert exit_reason == ExitReason.DENSITY_EROSION
+
+
+class TestStopLossWorker:
+    """Breakeven moves roll back unless the exchange stop-loss actually moved."""
+
+    @pytest.fixture
+    def order_executor(self):
+        executor = MagicMock()
+        executor.modify_stop_loss = AsyncMock(return_value=True)
+        return executor
+
+    @pytest.fixture
+    def monitor(self, db_manager, orderbook_manager, order_executor):
+        return PositionMonitor(db_manager, orderbook_manager, order_executor)
+
+    @pytest_asyncio.fixture
+    async def position(self, monitor):
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        # Checked at the current sequence, so only a rollback forces a recheck
+        monitor._last_checked_sequence[SYMBOL] = 1
+        await monitor._move_to_breakeven(position)
+        assert position.breakeven_moved
+        assert position.stop_loss == position.entry_price
+        return position
+
+    @pytest.mark.asyncio
+    async def test_confirmed_move_is_recorded(self, monitor, db_manager, order_executor, position):
+        await monitor._submit_stop_loss(position, Decimal("98"), position.entry_price)
+
+        order_executor.modify_stop_loss.assert_awaited_once_with(SYMBOL, Decimal("100"))
+        db_manager.update_trade_stop_loss.assert_awaited_once_with(
+            position.id, Decimal("100"), breakeven=True
+        )
+        assert position.breakeven_moved
+        assert position.stop_loss == Decimal("100")
+
+    @pytest.mark.asyncio
+    async def test_rejected_move_rolls_back(self, monitor, db_manager, order_executor, position):
+        order_executor.modify_stop_loss.return_value = False
+
+        await monitor._submit_stop_loss(position, Decimal("98"), position.entry_price)
+
+        assert not position.breakeven_moved
+        assert position.stop_loss == Decimal("98")
+        assert SYMBOL not in monitor._last_checked_sequence
+        db_manager.update_trade_stop_loss.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exchange_error_rolls_back(self, monitor, db_manager, order_executor, position):
+        order_executor.modify_stop_loss.side_effect = TimeoutError("request timed out")
+
+        await monitor._submit_stop_loss(position, Decimal("98"), position.entry_price)
+
+        assert not position.breakeven_moved
+        assert position.stop_loss == Decimal("98")
+        assert SYMBOL not in monitor._last_checked_sequence
+        db_manager.update_trade_stop_loss.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_database_error_keeps_move(self, monitor, db_manager, order_executor, position):
+        db_manager.update_trade_stop_loss.side_effect = RuntimeError("connection lost")
+
+        await monitor._submit_stop_loss(position, Decimal("98"), position.entry_price)
+
+        # The exchange stop moved, so the position must not retry the move
+        assert position.breakeven_moved
+        assert position.stop_loss == Decimal("100")
+        assert monitor._last_checked_sequence[SYMBOL] == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_errors(self, monitor, order_executor, position):
+        order_executor.modify_stop_loss.side_effect = [RuntimeError("api error"), True]
+        await monitor.start()
+        try:
+            await monitor._sl_submit_queue.join()
+            assert not position.breakeven_moved
+
+            await monitor._move_to_breakeven(position)
+            await monitor._sl_submit_queue.join()
+            assert position.breakeven_moved
+            assert order_executor.modify_stop_loss.await_count == 2
+        finally:
+            await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rolls_back(self, monitor, monkeypatch):
+        position = await start(monitor, make_position(PositionDirection.LONG))
+        monkeypatch.setattr(
+            monitor._sl_submit_queue,
+            "put_nowait",
+            MagicMock(side_effect=asyncio.QueueFull),
+        )
+
+        await monitor._move_to_breakeven(position)
+
+        assert not position.breakeven_moved
+        assert position.stop_loss == Decimal("98")
@@ -0,0 +1,126 @@
+"""
+Tests for the SafetyMonitor connection-health circuit breaker.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.position_management.safety_monitor import SafetyMonitor
+
+
+@pytest.fixture
+def safety_monitor():
+    order_executor = MagicMock()
+    order_executor.get_account_balance = AsyncMock(return_value=Decimal("1000"))
+    monitor = SafetyMonitor(
+        db_manager=MagicMock(),
+        order_executor=order_executor,
+        initial_balance=Decimal("1000"),
+        failure_threshold=3,
+        circuit_cooldown_seconds=10.0,
+        max_circuit_cooldown_seconds=40.0,
+    )
+    monitor._check_connection_health = AsyncMock(return_value=True)
+    return monitor
+
+
+def fail(monitor: SafetyMonitor, times: int) -> None:
+    for _ in range(times):
+        monitor._record_health_result(False)
+
+
+def test_stays_closed_below_failure_threshold(safety_monitor):
+    fail(safety_monitor, 2)
+
+    assert safety_monitor._circuit_state == "closed"
+    assert safety_monitor._consecutive_failures == 2
+    assert safety_monitor.is_trading_enabled()
+
+
+def test_success_resets_failure_count(safety_monitor):
+    fail(safety_monitor, 2)
+    safety_monitor._record_health_result(True)
+    fail(safety_monitor, 2)
+
+    assert safety_monitor._circuit_state == "closed"
+    assert safety_monitor._consecutive_failures == 2
+
+
+def test_opens_at_failure_threshold(safety_monitor, monkeypatch):
+    monkeypatch.setattr("time.monotonic", lambda: 1000.0)
+    fail(safety_monitor, 3)
+
+    assert safety_monitor._circuit_state == "open"
+    assert not safety_monitor.is_trading_enabled()
+    assert safety_monitor.get_status()["circuit_state"] == "open"
+    # Cooldown plus up to 25% jitter
+    assert 1010.0 <= safety_monitor._circuit_retry_at <= 1012.5
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(safety_monitor, monkeypatch):
+    monkeypatch.setattr("time.monotonic", lambda: 1000.0)
+    fail(safety_monitor, 3)
+
+    cooldowns = []
+    for _ in range(4):
+        safety_monitor._circuit_state = "half_open"
+        safety_monitor._record_health_result(False)
+        assert safety_monitor._circuit_state == "open"
+        cooldowns.append(safety_monitor._circuit_cooldown)
+
+    # Doubles after each failed probe, capped at the maximum
+    assert cooldowns == [20.0, 40.0, 40.0, 40.0]
+    assert 1040.0 <= safety_monitor._circuit_retry_at <= 1050.0
+
+
+def test_successful_probe_closes_and_resets(safety_monitor):
+    fail(safety_monitor, 3)
+    safety_monitor._circuit_state = "half_open"
+    safety_monitor._record_health_result(False)
+
+    safety_monitor._circuit_state = "half_open"
+    safety_monitor._record_health_result(True)
+
+    assert safety_monitor._circuit_state == "closed"
+    assert safety_monitor._consecutive_failures == 0
+    assert safety_monitor._circuit_cooldown == 10.0
+    assert safety_monitor.is_trading_enabled()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_until_cooldown(safety_monitor):
+    fail(safety_monitor, 3)
+    retry_at = safety_monitor._circuit_retry_at
+
+    assert not await safety_monitor._check_connection_health_guarded(retry_at - 1.0)
+    safety_monitor._check_connection_health.assert_not_called()
+
+    # After the cooldown one probe runs; success closes the circuit
+    assert await safety_monitor._check_connection_health_guarded(retry_at)
+    safety_monitor._check_connection_health.assert_awaited_once()
+    assert safety_monitor._circuit_state == "closed"
+    assert safety_monitor.is_trading_enabled()
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_after_cooldown_reopens(safety_monitor):
+    fail(safety_monitor, 3)
+    safety_monitor._check_connection_health.return_value = False
+
+    assert not await safety_monitor._check_connection_health_guarded(
+        safety_monitor._circuit_retry_at
+    )
+    assert safety_monitor._circuit_state == "open"
+    assert safety_monitor._circuit_cooldown == 20.0
+
+
+@pytest.mark.asyncio
+async def test_capital_loss_checked_while_circuit_open(safety_monitor):
+    fail(safety_monitor, 3)
+    safety_monitor._check_capital_loss = AsyncMock(return_value=False)
+
+    assert not await safety_monitor.check_safety_conditions(balance=Decimal("800"))
+    safety_monitor._check_capital_loss.assert_awaited_once()
+    safety_monitor._check_connection_health.assert_not_called()